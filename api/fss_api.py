@@ -4,13 +4,14 @@ FSS FISIS API 연동 모듈 (collector.py + utils.py 통합)
 import json
 import re
 import ssl
+import threading
 import urllib3
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Executor, Future, InvalidStateError, ThreadPoolExecutor, as_completed
 from typing import Dict, List, Optional
 
 import requests
 
-from config import FSS_API_KEY
+from config import FSS_API_BASE, FSS_API_KEY, FSS_API_WORKERS
 
 # SSL 경고 억제
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -41,7 +42,10 @@ class LegacyAdapter(requests.adapters.HTTPAdapter):
 def get_session() -> requests.Session:
     """LegacyAdapter가 마운트된 세션 반환"""
     session = requests.Session()
-    session.mount('https://', LegacyAdapter())
+    # 수집 스레드 수만큼 연결을 유지 (기본 풀 크기 10)
+    pool = max(10, FSS_API_WORKERS)
+    session.mount('https://', LegacyAdapter(pool_maxsize=pool))
+    session.mount('http://', requests.adapters.HTTPAdapter(pool_maxsize=pool))
     return session
 
 
@@ -81,7 +85,7 @@ def quarter_to_month(quarter: str) -> str:
 # ── 증권사 목록 조회 ────────────────────────────────────────────────────────
 def fetch_company_list(session: requests.Session) -> List[dict]:
     url = (
-        f"http://fisis.fss.or.kr/openapi/companySearch.json"
+        f"{FSS_API_BASE}/companySearch.json"
         f"?lang=kr&auth={FSS_API_KEY}&partDiv=F"
     )
     try:
@@ -95,16 +99,13 @@ def fetch_company_list(session: requests.Session) -> List[dict]:
 
 
 # ── 개별 증권사 NCR 데이터 수집 ─────────────────────────────────────────────
-def fetch_ncr_data(session: requests.Session, company: dict, start_mm: str, end_mm: str) -> Optional[dict]:
-    """
-    FSS SF408 (연결NCR), SF304 (자본), SF308 (개별NCR) 순으로 조회.
-    Returns: metrics dict or None
-    """
-    finance_cd = company['finance_cd']
-    raw_name = company['finance_nm']
-    finance_nm = re.sub(r'\(주\)|주식회사|\s+', ' ', raw_name).strip()
+# 회사마다 SF408 (연결NCR)·SF304 (자본)·SF307 (손익)을 동시에 요청하고,
+# SF408·SF304 가 모두 도착한 시점에 SF308 (개별NCR) 대체 조회 여부를 정한다.
+# 목록 조회만 스레드 풀 작업으로 돌고, 회사 단위 조립은 완료 콜백에서 이어지므로
+# 모든 회사·목록 조회가 하나의 풀(동시 요청 수 상한)을 공유해도 서로 기다리며 막히지 않는다.
 
-    result = {
+def _new_ncr_result() -> dict:
+    return {
         "ncr": 0,
         "equity_capital": 0,
         "total_risk": 0,
@@ -114,56 +115,82 @@ def fetch_ncr_data(session: requests.Session, company: dict, start_mm: str, end_
         "net_income_q": None,
     }
 
-    def _get(list_no: str) -> Optional[dict]:
-        url = (
-            f"http://fisis.fss.or.kr/openapi/statisticsInfoSearch.json"
-            f"?lang=kr&auth={FSS_API_KEY}&financeCd={finance_cd}"
-            f"&listNo={list_no}&term=Q&startBaseMm={start_mm}&endBaseMm={end_mm}"
-        )
-        try:
-            res = session.get(url, timeout=10)
-            data = res.json()
-            if data['result']['err_cd'] == '000':
-                return data['result']['list']
-            return None
-        except Exception:
-            return None
-
-    # SF408 (연결 순자본비율)
-    rows = _get("SF408")
-    if rows:
-        for row in rows:
-            ac = row['account_cd']
+
+def _fetch_list(session: requests.Session, finance_cd: str, list_no: str,
+                start_mm: str, end_mm: str) -> Optional[list]:
+    url = (
+        f"{FSS_API_BASE}/statisticsInfoSearch.json"
+        f"?lang=kr&auth={FSS_API_KEY}&financeCd={finance_cd}"
+        f"&listNo={list_no}&term=Q&startBaseMm={start_mm}&endBaseMm={end_mm}"
+    )
+    try:
+        res = session.get(url, timeout=10)
+        data = res.json()
+        if data['result']['err_cd'] == '000':
+            return data['result']['list']
+        return None
+    except Exception:
+        return None
+
+
+def _apply_sf408(result: dict, rows: Optional[list]):
+    """SF408 (연결 순자본비율)"""
+    for row in rows or []:
+        ac = row['account_cd']
+        val = float(row['a']) if row['a'] else 0
+        if ac == 'E':   result['ncr'] = val
+        elif ac == 'B': result['total_risk'] = int(val / 100000000)
+        elif ac == 'D': result['required_equity'] = int(val / 100000000)
+        elif ac == 'A': result['operating_net_capital'] = int(val / 100000000)
+        elif ac == 'A1': result['equity_capital'] = int(val / 100000000)
+
+
+def _apply_sf304(result: dict, rows: Optional[list]):
+    """SF304 (자본총계)"""
+    for row in rows or []:
+        if row['account_cd'] == 'L':
             val = float(row['a']) if row['a'] else 0
+            result['equity_capital'] = int(val / 100000000)
+            break
+
+
+def _apply_sf308(result: dict, rows: Optional[list]):
+    """Fallback: SF308 (개별) — 연결 기준으로 채우지 못한 값만"""
+    for row in rows or []:
+        ac = row['account_cd']
+        val = float(row['a']) if row['a'] else 0
+        if result['ncr'] == 0:
             if ac == 'E':   result['ncr'] = val
             elif ac == 'B': result['total_risk'] = int(val / 100000000)
             elif ac == 'D': result['required_equity'] = int(val / 100000000)
             elif ac == 'A': result['operating_net_capital'] = int(val / 100000000)
-            elif ac == 'A1': result['equity_capital'] = int(val / 100000000)
-
-    # SF304 (자본총계)
-    rows = _get("SF304")
-    if rows:
-        for row in rows:
-            if row['account_cd'] == 'L':
-                val = float(row['a']) if row['a'] else 0
-                result['equity_capital'] = int(val / 100000000)
-                break
-
-    # Fallback: SF308 (개별)
-    if result['ncr'] == 0 or result['equity_capital'] == 0:
-        rows = _get("SF308")
-        if rows:
-            for row in rows:
-                ac = row['account_cd']
-                val = float(row['a']) if row['a'] else 0
-                if result['ncr'] == 0:
-                    if ac == 'E':   result['ncr'] = val
-                    elif ac == 'B': result['total_risk'] = int(val / 100000000)
-                    elif ac == 'D': result['required_equity'] = int(val / 100000000)
-                    elif ac == 'A': result['operating_net_capital'] = int(val / 100000000)
-                if result['equity_capital'] == 0 and ac == 'A1':
-                    result['equity_capital'] = int(val / 100000000)
+        if result['equity_capital'] == 0 and ac == 'A1':
+            result['equity_capital'] = int(val / 100000000)
+
+
+def _apply_sf307(result: dict, rows: Optional[list]):
+    """당기순이익(분기 단독): SF307 'a' 컬럼 = 당분기값 직접 사용"""
+    for row in rows or []:
+        if row.get('account_cd') == 'J':
+            val_a = float(row['a']) if row.get('a') else None
+            if val_a is not None:
+                result['net_income_q'] = int(val_a / 100000000)
+            break
+
+
+def _needs_sf308(fetched: dict) -> bool:
+    result = _new_ncr_result()
+    _apply_sf408(result, fetched["SF408"])
+    _apply_sf304(result, fetched["SF304"])
+    return result['ncr'] == 0 or result['equity_capital'] == 0
+
+
+def _build_ncr_data(finance_cd: str, finance_nm: str, fetched: dict) -> Optional[dict]:
+    result = _new_ncr_result()
+    _apply_sf408(result, fetched["SF408"])
+    _apply_sf304(result, fetched["SF304"])
+    if "SF308" in fetched:
+        _apply_sf308(result, fetched["SF308"])
 
     # 구NCR 계산
     if result['total_risk'] > 0:
@@ -171,15 +198,7 @@ def fetch_ncr_data(session: requests.Session, company: dict, start_mm: str, end_
             (result['operating_net_capital'] / result['total_risk']) * 100, 2
         )
 
-    # 당기순이익(분기 단독): SF307 'a' 컬럼 = 당분기값 직접 사용
-    rows_inc = _get("SF307")
-    if rows_inc:
-        for row in rows_inc:
-            if row.get('account_cd') == 'J':
-                val_a = float(row['a']) if row.get('a') else None
-                if val_a is not None:
-                    result['net_income_q'] = int(val_a / 100000000)
-                break
+    _apply_sf307(result, fetched["SF307"])
 
     # 데이터 없으면 None
     if result['equity_capital'] == 0 and result['ncr'] == 0:
@@ -193,6 +212,69 @@ def fetch_ncr_data(session: requests.Session, company: dict, start_mm: str, end_
     }
 
 
+def schedule_ncr_data(executor: Executor, session: requests.Session, company: dict,
+                      start_mm: str, end_mm: str) -> Future:
+    """
+    회사 1곳의 NCR 조회를 executor 에 예약하고 결과 Future 를 즉시 반환.
+
+    Future 결과는 fetch_ncr_data 와 같다 (metrics dict 또는 None).
+    예약 함수는 블로킹하지 않으므로 executor 의 작업 스레드 안에서 호출해도 된다.
+    """
+    finance_cd = company['finance_cd']
+    raw_name = company['finance_nm']
+    finance_nm = re.sub(r'\(주\)|주식회사|\s+', ' ', raw_name).strip()
+
+    done: Future = Future()
+    fetched: dict = {}
+    pending = {"SF408", "SF304", "SF307"}
+    lock = threading.Lock()
+
+    def submit(list_no: str):
+        future = executor.submit(_fetch_list, session, finance_cd, list_no, start_mm, end_mm)
+        future.add_done_callback(lambda f: on_list_done(list_no, f))
+
+    def fail(exc: BaseException):
+        try:
+            done.set_exception(exc)
+        except InvalidStateError:
+            pass  # 이미 결과·예외가 정해졌으면 처음 것을 유지
+
+    def on_list_done(list_no: str, future: Future):
+        # 콜백 예외는 concurrent.futures 가 로그만 남기고 삼키므로, 어떤 오류든 done 에 실어야
+        # 호출 측(as_completed)이 영원히 기다리지 않는다
+        try:
+            rows = None if future.exception() else future.result()
+            fallback = False
+            with lock:
+                fetched[list_no] = rows
+                pending.discard(list_no)
+                if list_no in ("SF408", "SF304") and "SF408" in fetched and "SF304" in fetched:
+                    fallback = _needs_sf308(fetched)
+                    if fallback:
+                        pending.add("SF308")
+                finished = not pending
+            if fallback:
+                submit("SF308")  # executor 종료 후면 RuntimeError
+            if finished:
+                done.set_result(_build_ncr_data(finance_cd, finance_nm, fetched))
+        except Exception as e:
+            fail(e)
+
+    for list_no in ("SF408", "SF304", "SF307"):
+        submit(list_no)
+    return done
+
+
+def fetch_ncr_data(session: requests.Session, company: dict, start_mm: str, end_mm: str) -> Optional[dict]:
+    """
+    FSS SF408 (연결NCR), SF304 (자본), SF307 (손익)을 동시에 조회하고
+    필요하면 SF308 (개별NCR)로 보완.
+    Returns: metrics dict or None
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        return schedule_ncr_data(executor, session, company, start_mm, end_mm).result()
+
+
 # ── 전체 증권사 데이터 수집 ──────────────────────────────────────────────────
 def collect_all_securities_data(quarter: str) -> List[dict]:
     """
@@ -207,12 +289,13 @@ def collect_all_securities_data(quarter: str) -> List[dict]:
 
     companies = fetch_company_list(session)
 
+    # 모든 회사의 목록 조회가 FSS_API_WORKERS 개 스레드를 공유 (동시 요청 수 상한)
     results = []
-    with ThreadPoolExecutor(max_workers=5) as executor:
-        futures = {
-            executor.submit(fetch_ncr_data, session, c, mm, mm): c
+    with ThreadPoolExecutor(max_workers=FSS_API_WORKERS) as executor:
+        futures = [
+            schedule_ncr_data(executor, session, c, mm, mm)
             for c in companies
-        }
+        ]
         for future in as_completed(futures):
             res = future.result()
             if res:
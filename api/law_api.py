@@ -8,33 +8,38 @@
 환경변수 LAW_API_KEY (.env)에 법제처 API 키를 설정해야 합니다.
 키 발급: https://open.law.go.kr/LSO/main.do → 오픈API 신청
 """
+import hashlib
+import itertools
+import random
 import re
+import threading
+import time
 import xml.etree.ElementTree as ET
-from typing import Optional
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterator, Optional, TypeVar
 
 import requests
 
-from config import LAW_API_KEY
-from db import upsert_document, insert_articles, update_article_count
+from config import LAW_API_BASE, LAW_API_KEY, LAW_CRAWL_WORKERS
+from db import get_law_cache, ingest_document, put_law_cache, transaction, upsert_document
+
+T = TypeVar("T")
 
 _PARAGRAPH_START = re.compile(r"^[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮]|^\d+\.\s|^[가나다라마바사아자차카타파하]\.\s")
 
 
 def _normalize_law_text(text: str) -> str:
-    lines = text.splitlines()
-    result = ""
-    for line in lines:
+    parts: list[str] = []
+    for line in text.splitlines():
         stripped = line.strip()
         if not stripped:
             continue
-        if not result:
-            result = stripped
-        elif _PARAGRAPH_START.match(stripped):
-            result += "\n" + stripped
-        else:
-            result += " " + stripped
-    result = re.sub(r"[ \t]{2,}", " ", result)
-    return result
+        if parts:
+            parts.append("\n" if _PARAGRAPH_START.match(stripped) else " ")
+        parts.append(stripped)
+    return re.sub(r"[ \t]{2,}", " ", "".join(parts))
 
 
 # ── 크롤링 대상 법령 목록 ───────────────────────────────────────────────────
@@ -64,19 +69,116 @@ MANAGED_LAWS = [
 
 def _get_endpoint(law_type: str) -> str:
     if law_type == "admrul":
-        return "https://open.law.go.kr/LSO/openApi/getMOLSAdmRul.do"
-    return "https://open.law.go.kr/LSO/openApi/getMOLSLaw.do"
+        return f"{LAW_API_BASE}/getMOLSAdmRul.do"
+    return f"{LAW_API_BASE}/getMOLSLaw.do"
 
 
-def fetch_law_articles(
-    law_name: str, law_type: str = "law"
-) -> tuple[list[dict], Optional[str]]:
-    """
-    법제처 API로 조문 목록과 시행일을 수신.
+# ── HTTP 세션 · 재시도 ──────────────────────────────────────────────────────
+# 모듈 전역 세션 하나를 크롤링 스레드들이 공유한다 (keep-alive 로 TCP/TLS 연결 재사용).
+# 연결 오류·타임아웃·5xx·429 는 지수 백오프 + full jitter 로 재시도하며,
+# 429/503 의 Retry-After 헤더가 있으면 그 값을 우선한다.
+# 요청(시도)마다 소요 시간을 기록하여 latency_stats() 로 조회할 수 있다.
 
-    Returns: (articles, effective_date)
-    Raises: ValueError | requests.RequestException | ET.ParseError
+_MAX_RETRIES   = 3
+_BACKOFF_BASE  = 0.5     # 초 — 시도 n 의 최대 대기 = min(_BACKOFF_CAP, _BACKOFF_BASE * 2**n)
+_BACKOFF_CAP   = 8.0
+_RETRY_STATUS  = frozenset({429, 500, 502, 503, 504})
+_RETRY_ERRORS  = (
+    requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError,
+)
+_LATENCY_WINDOW = 500
+
+_session: requests.Session | None = None
+_session_lock = threading.Lock()
+_latencies: deque = deque(maxlen=_LATENCY_WINDOW)
+_latency_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # 동시 크롤링 스레드 수만큼 연결을 유지
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=max(LAW_CRAWL_WORKERS, 10))
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+        return _session
+
+
+def _backoff_delay(attempt: int, resp: requests.Response | None = None) -> float:
+    if resp is not None:
+        retry_after = resp.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            return min(_BACKOFF_CAP, float(retry_after))
+    return random.uniform(0, min(_BACKOFF_CAP, _BACKOFF_BASE * 2 ** attempt))
+
+
+def _record_latency(url: str, status: int | None, elapsed: float, attempt: int):
+    with _latency_lock:
+        _latencies.append({
+            "url": url, "status": status, "elapsed": elapsed, "attempt": attempt,
+        })
+
+
+def latency_stats() -> dict:
+    """최근 요청(재시도 포함 시도 단위)의 소요 시간 통계 (초)"""
+    with _latency_lock:
+        samples = list(_latencies)
+    if not samples:
+        return {"requests": 0, "retries": 0, "errors": 0, "p50": None, "p95": None, "max": None}
+    times = sorted(s["elapsed"] for s in samples)
+    return {
+        "requests": len(samples),
+        "retries": sum(1 for s in samples if s["attempt"] > 0),
+        "errors": sum(1 for s in samples if s["status"] is None or s["status"] >= 400),
+        "p50": times[len(times) // 2],
+        "p95": times[min(len(times) - 1, int(len(times) * 0.95))],
+        "max": times[-1],
+    }
+
+
+def _get_with_retry(url: str, params: dict, read: Callable[[requests.Response], T], timeout: float = 30) -> T:
     """
+    GET 요청 후 read(resp) 결과 반환. 본문 읽기까지 한 시도로 보고,
+    도중에 연결이 끊기면 처음부터 다시 요청한다.
+    """
+    for attempt in range(_MAX_RETRIES + 1):
+        started = time.perf_counter()
+        resp = None
+        try:
+            with _get_session().get(url, params=params, timeout=timeout, stream=True) as resp:
+                if resp.status_code in _RETRY_STATUS and attempt < _MAX_RETRIES:
+                    resp.content  # 오류 본문을 비워 연결을 풀에 돌려준다
+                    _record_latency(url, resp.status_code, time.perf_counter() - started, attempt)
+                    time.sleep(_backoff_delay(attempt, resp))
+                    continue
+                resp.raise_for_status()
+                result = read(resp)
+        except _RETRY_ERRORS:
+            _record_latency(url, None, time.perf_counter() - started, attempt)
+            if attempt >= _MAX_RETRIES:
+                raise
+            time.sleep(_backoff_delay(attempt))
+            continue
+        except requests.HTTPError:
+            _record_latency(url, resp.status_code, time.perf_counter() - started, attempt)
+            raise
+        _record_latency(url, resp.status_code, time.perf_counter() - started, attempt)
+        return result
+    raise AssertionError("unreachable")
+
+
+# 응답은 조각 단위로 받아 해시·압축만 하고 원문 전체를 메모리에 두지 않는다.
+# 파싱은 압축본을 조금씩 풀면서 iterparse 로 진행하고, 조문 요소는 내보낸 즉시 트리에서 떼어낸다.
+# 최대 메모리 ≈ 압축된 응답 + 조문 1건 (이전: 원문 + 전체 DOM + 조문 목록).
+
+_CHUNK_SIZE = 64 * 1024
+
+
+def _fetch_law_xml(law_name: str, law_type: str) -> tuple[str, str, bytes]:
+    """법제처 API 요청 → (엔드포인트, 응답 SHA-256, zlib 압축된 응답 원문)"""
     if not LAW_API_KEY:
         raise ValueError(
             "LAW_API_KEY가 설정되어 있지 않습니다.\n"
@@ -91,58 +193,154 @@ def fetch_law_articles(
         "query":  law_name,
     }
 
-    resp = requests.get(endpoint, params=params, timeout=30)
-    resp.raise_for_status()
+    def read(resp: requests.Response) -> tuple[str, bytes]:
+        digest = hashlib.sha256()
+        compressor = zlib.compressobj(6)
+        parts: list[bytes] = []
+        for chunk in resp.iter_content(_CHUNK_SIZE):
+            digest.update(chunk)
+            parts.append(compressor.compress(chunk))
+        parts.append(compressor.flush())
+        return digest.hexdigest(), b"".join(parts)
+
+    content_hash, payload = _get_with_retry(endpoint, params, read)
+    return endpoint, content_hash, payload
+
 
-    root = ET.fromstring(resp.content)
+class _InflateReader:
+    """zlib 압축 바이트를 read(n) 요청만큼씩 풀어 주는 파일 객체 (iterparse 입력용)"""
 
-    effective_date = (
-        root.findtext(".//시행일")
-        or root.findtext(".//공포일")
-        or root.findtext(".//법령정보/시행일")
-    )
+    def __init__(self, payload: bytes):
+        self._payload = memoryview(payload)
+        self._pos = 0
+        self._inflater = zlib.decompressobj()
 
-    articles = []
-    for article in root.iter("조문"):
-        text = article.findtext("조문내용") or ""
-        if not text.strip():
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size <= 0:
+            size = _CHUNK_SIZE
+        while True:
+            if self._inflater.unconsumed_tail:
+                data = self._inflater.decompress(self._inflater.unconsumed_tail, size)
+            elif self._pos < len(self._payload):
+                chunk = self._payload[self._pos:self._pos + _CHUNK_SIZE]
+                self._pos += len(chunk)
+                data = self._inflater.decompress(chunk, size)
+            else:
+                return self._inflater.flush()
+            if data:
+                return data
+
+
+def _iter_law_articles(stream, meta: dict) -> Iterator[dict]:
+    """
+    법령 XML 을 스트리밍 파싱하여 조문 dict 를 하나씩 생성.
+
+    문서 순서상 처음 나오는 시행일·공포일은 meta["시행일"]·meta["공포일"] 에 기록한다
+    (법제처 응답은 기본정보가 조문보다 앞에 오므로 첫 조문이 나올 때 이미 채워져 있다).
+    """
+    path: list[ET.Element] = []
+    for event, elem in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(elem)
             continue
-        articles.append({
-            "article_number": article.findtext("조문번호") or "",
-            "article_title":  article.findtext("조문제목") or "",
-            "article_text":   _normalize_law_text(text),
-            "page_number":    None,
-        })
+        path.pop()
+        if elem.tag in ("시행일", "공포일"):
+            if elem.text and elem.tag not in meta:
+                meta[elem.tag] = elem.text
+        elif elem.tag == "조문":
+            text = elem.findtext("조문내용") or ""
+            if text.strip():
+                yield {
+                    "article_number": elem.findtext("조문번호") or "",
+                    "article_title":  elem.findtext("조문제목") or "",
+                    "article_text":   _normalize_law_text(text),
+                    "page_number":    None,
+                }
+            elem.clear()
+            if path:
+                path[-1].remove(elem)
+
+
+def _effective_date(meta: dict) -> Optional[str]:
+    return meta.get("시행일") or meta.get("공포일")
+
+
+def fetch_law_articles(
+    law_name: str, law_type: str = "law"
+) -> tuple[list[dict], Optional[str]]:
+    """
+    법제처 API로 조문 목록과 시행일을 수신.
+
+    Returns: (articles, effective_date)
+    Raises: ValueError | requests.RequestException | ET.ParseError
+    """
+    _, _, payload = _fetch_law_xml(law_name, law_type)
+    meta: dict = {}
+    articles = list(_iter_law_articles(_InflateReader(payload), meta))
+    return articles, _effective_date(meta)
 
-    return articles, effective_date
 
+# 크롤링 스레드의 DB 쓰기 직렬화 — 동시에 BEGIN IMMEDIATE 를 열면 나중 스레드가
+# busy_timeout 을 넘겨 "database is locked" 로 실패한다.
+# 조문은 목록으로 모으지 않고 파싱되는 대로 적재하므로(메모리 ≈ 압축 응답 + 조문 1건)
+# 파싱·정규화도 쓰기 트랜잭션 안에서 진행된다. 그동안 다른 쓰기(화면의 작업 진행률 등)는
+# 기다리거나 건너뛴다 — 크롤링끼리만 이 잠금으로 줄 세운다.
+_WRITE_LOCK = threading.Lock()
 
-def crawl_single_law(law_info: dict) -> tuple[bool, str]:
+
+def crawl_single_law(law_info: dict, force: bool = False) -> tuple[bool, str]:
     """
     단일 법령을 API로 수신하여 DB에 저장.
 
+    응답 원문이 지난번(db.law_cache)과 같으면 파싱·DB 쓰기 없이 끝낸다 (요청 1회).
+    force=True 이면 캐시와 무관하게 다시 파싱·적재한다.
+    조문은 목록으로 모으지 않고 파싱되는 대로 ingest_document 로 흘려 넣으며,
+    적재는 _WRITE_LOCK 으로 한 번에 한 법령씩 한다.
+
     Returns: (success, message)
     """
     try:
-        articles, effective_date = fetch_law_articles(
-            law_info["name"], law_info["type"]
-        )
+        endpoint, content_hash, payload = _fetch_law_xml(law_info["name"], law_info["type"])
+
+        cached = get_law_cache(endpoint, law_info["name"], law_info["type"])
+        if not force and cached and cached["content_hash"] == content_hash:
+            date_str = cached["effective_date"] or "날짜 미상"
+            return True, f"✅ {law_info['name']} — 변경 없음 (시행일: {date_str})"
 
-        if not articles:
+        meta: dict = {}
+        articles = _iter_law_articles(_InflateReader(payload), meta)
+        first = next(articles, None)
+        if first is None:
             return False, f"⚠️ {law_info['name']}: 조문을 가져오지 못했습니다 (0개 수신)."
+        effective_date = _effective_date(meta)
 
-        doc_id = upsert_document(
-            doc_name=law_info["name"],
-            doc_category=law_info["category"],
-            filename="",
-            enacted_date=effective_date,
-            source_type="crawler",
-        )
-        insert_articles(doc_id, articles)
-        update_article_count(doc_id, len(articles))
+        # 적재와 캐시 갱신을 한 트랜잭션으로 — 적재 실패 시 캐시도 이전 상태 유지
+        with _WRITE_LOCK, transaction():
+            diff = ingest_document(
+                doc_name=law_info["name"],
+                doc_category=law_info["category"],
+                articles=itertools.chain([first], articles),
+                enacted_date=effective_date,
+                source_type="crawler",
+            )
+            if _effective_date(meta) != effective_date:
+                # 시행일이 조문 뒤에 나오는 응답 — 문서 메타데이터만 다시 갱신
+                effective_date = _effective_date(meta)
+                upsert_document(
+                    law_info["name"], law_info["category"], "",
+                    effective_date, source_type="crawler", replace_articles=False,
+                )
+            put_law_cache(
+                endpoint, law_info["name"], law_info["type"], diff["doc_id"],
+                effective_date, content_hash, payload,
+            )
 
+        n_articles = diff["inserted"] + diff["updated"] + diff["unchanged"]
         date_str = effective_date or "날짜 미상"
-        return True, f"✅ {law_info['name']} — {len(articles)}개 조문 (시행일: {date_str})"
+        return True, (
+            f"✅ {law_info['name']} — {n_articles}개 조문 (시행일: {date_str})"
+            f" · 신규 {diff['inserted']} · 변경 {diff['updated']} · 삭제 {diff['deleted']}"
+        )
 
     except ValueError as e:
         return False, f"❌ {law_info['name']}: {e}"
@@ -152,3 +350,25 @@ def crawl_single_law(law_info: dict) -> tuple[bool, str]:
         return False, f"❌ {law_info['name']}: 응답 파싱 오류 — {e}"
     except Exception as e:
         return False, f"❌ {law_info['name']}: 알 수 없는 오류 — {e}"
+
+
+def crawl_laws(
+    laws: list[dict], max_workers: int | None = None, force: bool = False,
+) -> Iterator[tuple[dict, bool, str]]:
+    """
+    여러 법령을 동시에 크롤링하여 완료되는 순서대로 (law_info, success, message) 생성.
+
+    동시 요청 수는 max_workers (None 이면 config.LAW_CRAWL_WORKERS)로 제한한다.
+    법령마다 crawl_single_law 가 자기 스레드의 연결로 ingest_document 를 호출하므로
+    한 법령의 저장은 독립된 트랜잭션으로 커밋되고, 다른 법령의 실패에 영향받지 않는다.
+    다운로드는 병렬로 진행되고, 파싱·적재는 _WRITE_LOCK 으로 한 법령씩 차례로 한다.
+    """
+    if not laws:
+        return
+    n_workers = max(1, min(max_workers or LAW_CRAWL_WORKERS, len(laws)))
+    with ThreadPoolExecutor(max_workers=n_workers, thread_name_prefix="law-crawl") as executor:
+        futures = {executor.submit(crawl_single_law, law, force): law for law in laws}
+        for future in as_completed(futures):
+            law = futures[future]
+            success, msg = future.result()
+            yield law, success, msg
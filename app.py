@@ -10,7 +10,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 import streamlit as st
 
 import db
-from utils.search import highlight_full_text, category_badge
+from utils.search import highlight_full_text, category_badge, normalize_article_text
 
 st.set_page_config(
     page_title="Sentinel.DS | DS투자증권 리스크 포털",
@@ -23,6 +23,7 @@ st.set_page_config(
 db.init_db()
 db.init_fss_tables()
 db.init_pnl_tables()
+db.init_job_tables()
 
 SB_W       = "70px"
 SB_TOTAL_W = "86px"  # left:8px + width:70px + gap:8px
@@ -388,9 +389,11 @@ def _render_side_panel():
         )
         return
 
+    # 검색 결과 행에는 스니펫만 있으므로 전문은 패널을 열 때 조회
+    full      = db.get_article(article["id"]) or article
     art_num   = article.get("article_number") or ""
     art_title = article.get("article_title") or ""
-    art_text  = article.get("article_text", "")
+    art_text  = full.get("display_text") or normalize_article_text(full.get("article_text", ""))
     enacted   = article.get("enacted_date") or ""
     title_str = f" ({art_title})" if art_title else ""
 
@@ -0,0 +1,55 @@
+"""
+백그라운드 작업(core.jobs) 진행 상황 표시 컴포넌트.
+
+작업이 진행 중이면 일정 주기로 이 부분만 다시 그려(폴링) 진행률을 갱신하고,
+작업이 끝나는 순간 페이지 전체를 rerun 하여 목록 등 다른 화면도 최신 상태로 만든다.
+"""
+import streamlit as st
+
+from core import jobs
+
+_POLL_SECONDS = 2
+
+# st.fragment (1.37+) / st.experimental_fragment (1.33+) — 없으면 수동 새로고침 버튼
+_fragment = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+
+_LEVELS = {"success": st.success, "warning": st.warning, "error": st.error, "info": st.info}
+
+
+def render_job_status(kind: str, label: str):
+    """kind 종류의 가장 최근 작업 상태·결과를 표시"""
+    job = jobs.latest_job(kind)
+    if job is None:
+        return
+    if job["active"] and _fragment is not None:
+        _fragment(run_every=_POLL_SECONDS)(_render)(kind, label)
+    else:
+        _render(kind, label, job)
+
+
+def _render(kind: str, label: str, job: dict | None = None):
+    job = job or jobs.latest_job(kind)
+    if job is None:
+        return
+    seen_key = f"_job_active_{kind}"
+
+    if job["active"]:
+        st.session_state[seen_key] = job["id"]
+        text = job["message"] or ("대기 중..." if job["status"] == "queued" else "진행 중...")
+        st.progress(job["progress"], text=f"{label} — {text}")
+        if _fragment is None and st.button("진행 상황 새로고침", key=f"_job_refresh_{kind}"):
+            st.rerun()
+        return
+
+    # 이 세션이 진행 중으로 보던 작업이 방금 끝났으면 페이지 전체를 갱신
+    if st.session_state.pop(seen_key, None) == job["id"]:
+        st.rerun()
+
+    finished = (job["finished_at"] or "")[:19].replace("T", " ")
+    if job["status"] == "failed":
+        st.error(f"{label} 실패 ({finished}) — {job['error']}")
+        return
+    messages = (job["result"] or {}).get("messages", [])
+    with st.expander(f"최근 {label} 결과 ({finished})", expanded=False):
+        for level, text in messages:
+            _LEVELS.get(level, st.info)(text)
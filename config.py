@@ -18,6 +18,33 @@ DB_PATH = PROJECT_ROOT / "data" / "sentinel.db"
 LAW_API_KEY = os.getenv("LAW_API_KEY", "")
 FSS_API_KEY  = os.getenv("FSS_API_KEY") or "4b992ee15d8514a53aeb93a15169b8b4"
 
+# 외부 API 기본 URL (부하·회귀 테스트 시 tools.mock_api 로컬 서버로 바꿔 지정)
+FSS_API_BASE = os.getenv("FSS_API_BASE", "http://fisis.fss.or.kr/openapi").rstrip("/")
+LAW_API_BASE = os.getenv("LAW_API_BASE", "https://open.law.go.kr/LSO/openApi").rstrip("/")
+
+# FISIS 통계 조회 동시 요청 수 (전체 증권사 수집 시 회사·목록 조회 공용)
+FSS_API_WORKERS = int(os.getenv("FSS_API_WORKERS", "8"))
+
+# 법제처 API 동시 크롤링 스레드 수
+LAW_CRAWL_WORKERS = int(os.getenv("LAW_CRAWL_WORKERS", "4"))
+
+# 백그라운드 작업(크롤링·수집) 동시 실행 수
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+
+# PDF 텍스트 추출 병렬 프로세스 수 (0 = CPU 코어 수)
+PDF_EXTRACT_WORKERS = int(os.getenv("PDF_EXTRACT_WORKERS", "0"))
+
+# PDF 텍스트 추출 백엔드: pdfplumber(기본) | pypdf | pymupdf (pypdf·pymupdf 는 별도 설치)
+PDF_BACKEND = os.getenv("PDF_BACKEND", "pdfplumber")
+# 분류별 추출 백엔드 (지정하지 않은 분류는 PDF_BACKEND)
+PDF_BACKEND_BY_CATEGORY: dict[str, str] = {}
+
+# 저메모리 추출 모드 (쪽별 레이아웃 객체 즉시 해제, 단일 프로세스) — 작은 컨테이너용
+PDF_LOW_MEMORY = os.getenv("PDF_LOW_MEMORY", "0") == "1"
+
+# PDF 파싱 결과 캐시 최대 크기 (압축 후 바이트)
+PARSE_CACHE_MAX_BYTES = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+
 # 레이아웃 설정
 LAYOUT = {
     "topbar_height": 68,
@@ -0,0 +1,144 @@
+"""
+백그라운드 작업 실행기 (법령 크롤링, FSS 수집 등 오래 걸리는 작업용).
+
+Streamlit 스크립트 스레드 밖의 프로세스 전역 스레드 풀에서 실행되므로
+화면 rerun·브라우저 탭 종료와 무관하게 끝까지 진행된다.
+상태·진행률·결과는 db.jobs 테이블에 기록되고, 화면은 get_job / latest_job 으로 폴링한다.
+
+    jobs.register("law_crawl", handler)          # handler(params, report) -> dict
+    job_id = jobs.submit("law_crawl", {"laws": [...]})
+
+- 같은 종류·같은 파라미터의 작업이 대기·실행 중이면 새로 만들지 않고 그 작업 id 를 돌려준다.
+- handler 는 report(진행률 0~1, 메시지) 로 진행 상황을 알리고, 결과 dict(JSON 직렬화 가능)를 반환한다.
+  예외가 나면 작업은 failed 로 끝나고 예외 메시지가 error 에 남는다.
+- 서버 프로세스가 재시작되면 이전 프로세스의 미완료 작업은 실패로 정리된다.
+"""
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import db
+from config import JOB_WORKERS
+
+Report = Callable[[float, str], None]
+Handler = Callable[[dict, Report], dict]
+
+# 이 프로세스가 등록한 작업 표시 — 다른 값이 남은 미완료 작업은 이전 프로세스의 것
+_OWNER = uuid.uuid4().hex
+
+_HANDLERS: dict[str, Handler] = {}
+_executor: ThreadPoolExecutor | None = None
+_lock = threading.Lock()
+
+
+def register(kind: str, handler: Handler):
+    _HANDLERS[kind] = handler
+
+
+def _fail_orphaned_jobs():
+    """
+    이전 프로세스의 미완료 작업을 실패로 정리.
+    모듈을 처음 불러올 때(프로세스당 1회) 실행한다 — 작업을 제출하기 전에도
+    화면이 죽은 작업을 진행 중으로 보고 계속 폴링하지 않도록.
+    """
+    db.init_job_tables()
+    n = db.fail_orphaned_jobs(_OWNER, "서버 재시작으로 중단되었습니다.")
+    if n:
+        print(f"[jobs] 이전 프로세스의 미완료 작업 {n}건을 실패 처리")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=max(1, JOB_WORKERS), thread_name_prefix="job")
+        return _executor
+
+
+def _dedup_key(kind: str, params: dict) -> str:
+    return kind + ":" + json.dumps(params, sort_keys=True, ensure_ascii=False)
+
+
+def submit(kind: str, params: dict) -> int:
+    """작업 등록 후 id 반환 (같은 작업이 이미 대기·실행 중이면 그 id)"""
+    if kind not in _HANDLERS:
+        raise ValueError(f"등록되지 않은 작업 종류: {kind}")
+    executor = _get_executor()
+    job_id, created = db.create_job(
+        kind, json.dumps(params, ensure_ascii=False), _dedup_key(kind, params), _OWNER,
+    )
+    if created:
+        executor.submit(_run, job_id, kind, params)
+    return job_id
+
+
+# 상태 갱신은 크롤링 적재 등 다른 쓰기와 SQLite 잠금을 다툰다.
+# 진행률(start/report)은 부가 정보라 잠겨 있으면 그 갱신만 건너뛰고,
+# 종료 기록은 작업이 활성 상태로 남아 중복 방지 색인에 막히지 않도록 성공할 때까지 재시도한다.
+
+_FINISH_RETRY_DELAY = 1.0   # 초 — 재시도마다 두 배, _FINISH_RETRY_CAP 까지
+_FINISH_RETRY_CAP   = 10.0
+
+
+def _best_effort(fn: Callable, *args):
+    try:
+        fn(*args)
+    except sqlite3.OperationalError:
+        pass
+
+
+def _finish(job_id: int, status: str, result: str | None = None, error: str | None = None):
+    delay = _FINISH_RETRY_DELAY
+    while True:
+        try:
+            db.finish_job(job_id, status, result=result, error=error)
+            return
+        except sqlite3.OperationalError as e:
+            print(f"[jobs] 작업 {job_id} 종료 기록 재시도 ({e})")
+            time.sleep(delay)
+            delay = min(_FINISH_RETRY_CAP, delay * 2)
+
+
+def _run(job_id: int, kind: str, params: dict):
+    def report(progress: float, message: str):
+        _best_effort(db.set_job_progress, job_id, max(0.0, min(1.0, progress)), message)
+
+    try:
+        _best_effort(db.start_job, job_id)
+        result = json.dumps(_HANDLERS[kind](params, report) or {}, ensure_ascii=False)
+    except Exception as e:
+        _finish(job_id, "failed", error=f"{type(e).__name__}: {e}")
+    else:
+        _finish(job_id, "success", result=result)
+    finally:
+        db.close_conn()
+
+
+def _decode(job: dict | None) -> dict | None:
+    if job is None:
+        return None
+    job["params"] = json.loads(job["params"])
+    job["result"] = json.loads(job["result"]) if job["result"] else None
+    job["active"] = job["status"] in ("queued", "running")
+    return job
+
+
+def get_job(job_id: int) -> dict | None:
+    return _decode(db.get_job(job_id))
+
+
+def latest_job(kind: str) -> dict | None:
+    """해당 종류의 가장 최근 작업 (없으면 None)"""
+    jobs = db.get_jobs(kind, limit=1)
+    return _decode(jobs[0]) if jobs else None
+
+
+def recent_jobs(kind: str | None = None, limit: int = 20) -> list[dict]:
+    return [_decode(j) for j in db.get_jobs(kind, limit)]
+
+
+_fail_orphaned_jobs()
@@ -5,24 +5,131 @@ import hashlib
 import json
 import sqlite3
 import os
-from datetime import datetime
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from config import DB_PATH
+from utils.text import normalize_article_text
 
 
-def get_conn() -> sqlite3.Connection:
-    conn = sqlite3.connect(DB_PATH)
+# ── 커넥션 관리 ──────────────────────────────────────────────────────────────
+# 스레드(=Streamlit 세션 스크립트 스레드)마다 커넥션 1개를 열어 재사용한다.
+# WAL 모드에서는 읽기와 쓰기가 서로를 막지 않으므로 동시 세션의
+# "database is locked" 오류가 사라지고, busy_timeout으로 쓰기 경합은 대기 처리한다.
+
+_BUSY_TIMEOUT_MS = 5000
+
+_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA foreign_keys = ON",
+    f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}",
+    "PRAGMA cache_size = -16000",       # 약 16MB (음수 = KiB 단위)
+    "PRAGMA mmap_size = 268435456",     # 256MB
+    "PRAGMA temp_store = MEMORY",
+)
+
+_local = threading.local()
+
+
+def _open_conn(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path, timeout=_BUSY_TIMEOUT_MS / 1000)
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON")
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+def _thread_conn() -> sqlite3.Connection:
+    """현재 스레드 전용 커넥션 반환 (없으면 생성)"""
+    path = str(DB_PATH)
+    conn = getattr(_local, "conn", None)
+    if conn is None or getattr(_local, "path", None) != path:
+        if conn is not None:
+            conn.close()
+        conn = _open_conn(path)
+        _local.conn = conn
+        _local.path = path
+        _local.tx_depth = 0
     return conn
 
 
+@contextmanager
+def get_conn() -> Iterator[sqlite3.Connection]:
+    """
+    스레드 커넥션을 빌려준다.
+
+    블록이 정상 종료되면 커밋, 예외 시 롤백한다.
+    transaction() 안에서 호출되면 바깥 트랜잭션에 합류하고 커밋하지 않는다.
+    """
+    conn = _thread_conn()
+    if _local.tx_depth:
+        yield conn
+        return
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    명시적 쓰기 트랜잭션 (BEGIN IMMEDIATE).
+
+    블록 안에서 호출되는 db.* 함수들은 모두 같은 트랜잭션에 묶여
+    한 번에 커밋되거나 함께 롤백된다. 중첩 호출 시 가장 바깥 블록만 커밋한다.
+    """
+    conn = _thread_conn()
+    if _local.tx_depth:
+        _local.tx_depth += 1
+        try:
+            yield conn
+        finally:
+            _local.tx_depth -= 1
+        return
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    _local.tx_depth = 1
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        _local.tx_depth = 0
+
+
+def close_conn():
+    """현재 스레드의 커넥션을 닫는다 (작업 스레드 종료 시 등)"""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+        _local.path = None
+        _local.tx_depth = 0
+
+
 # ── DB 초기화 ───────────────────────────────────────────────────────────────
 
 def init_db():
     """규정검색 테이블 초기화"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    # 화면 rerun 마다 호출되므로 이미 갖춰진 DB 에서는 쓰기 잠금을 잡지 않아야 한다.
+    # CREATE ... IF NOT EXISTS 는 executescript 로만 실행한다 — 문장 캐시에 남은
+    # (테이블을 실제로 만들었던) 준비 문장을 재실행하면 쓰기 잠금부터 기다린다.
+    # 초기 데이터는 테이블을 처음 만들 때만 넣는다.
     with get_conn() as conn:
         conn.executescript("""
             CREATE TABLE IF NOT EXISTS documents (
@@ -41,16 +148,56 @@ def init_db():
                 article_number TEXT,
                 article_title TEXT,
                 article_text TEXT NOT NULL,
-                page_number INTEGER
+                page_number INTEGER,
+                display_text TEXT,
+                content_hash TEXT
             );
 
             CREATE INDEX IF NOT EXISTS idx_articles_doc_id ON articles(doc_id);
+
+            CREATE TABLE IF NOT EXISTS parse_cache (
+                content_key    TEXT PRIMARY KEY,
+                parser_version INTEGER NOT NULL,
+                payload        BLOB NOT NULL,
+                size           INTEGER NOT NULL,
+                last_used      TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+
+            CREATE TABLE IF NOT EXISTS law_cache (
+                endpoint       TEXT NOT NULL,
+                law_name       TEXT NOT NULL,
+                law_type       TEXT NOT NULL,
+                doc_id         INTEGER NOT NULL REFERENCES documents(id) ON DELETE CASCADE,
+                effective_date TEXT,
+                content_hash   TEXT NOT NULL,
+                payload        BLOB NOT NULL,
+                fetched_at     TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (endpoint, law_name, law_type)
+            );
         """)
         cols = [r[1] for r in conn.execute("PRAGMA table_info(documents)").fetchall()]
         if "enacted_date" not in cols:
             conn.execute("ALTER TABLE documents ADD COLUMN enacted_date TEXT")
         if "source_type" not in cols:
             conn.execute("ALTER TABLE documents ADD COLUMN source_type TEXT NOT NULL DEFAULT 'pdf'")
+        art_cols = [r[1] for r in conn.execute("PRAGMA table_info(articles)").fetchall()]
+        new_cols = [c for c in ("display_text", "content_hash") if c not in art_cols]
+        if new_cols:
+            # 컬럼 추가와 채우기를 한 트랜잭션으로 — 컬럼이 있으면 채워진 것이므로
+            # 이후 호출에서는 조문 전체를 훑지 않는다
+            with transaction():
+                for col in new_cols:
+                    conn.execute(f"ALTER TABLE articles ADD COLUMN {col} TEXT")
+                _backfill_article_columns(conn)
+        _init_article_indexes(conn)
+        if not _table_exists(conn, "search_meta"):
+            conn.execute("""
+                CREATE TABLE search_meta (
+                    key   TEXT PRIMARY KEY,
+                    value INTEGER NOT NULL
+                )
+            """)
+            conn.execute("INSERT INTO search_meta (key, value) VALUES ('corpus_version', 0)")
 
 
 def init_fss_tables():
@@ -82,12 +229,296 @@ def init_fss_tables():
         """)
 
 
+def _backfill_article_columns(conn: sqlite3.Connection):
+    """display_text / content_hash 컬럼 도입 이전에 적재된 조문 채우기"""
+    rows = conn.execute("""
+        SELECT id, article_number, article_title, article_text, page_number
+        FROM articles WHERE display_text IS NULL OR content_hash IS NULL
+    """).fetchall()
+    if rows:
+        conn.executemany(
+            "UPDATE articles SET display_text = ?, content_hash = ? WHERE id = ?",
+            [
+                (normalize_article_text(r["article_text"]), _article_hash(dict(r)), r["id"])
+                for r in rows
+            ],
+        )
+
+
+def _article_hash(article: dict) -> str:
+    """조문 내용 해시 (번호·제목·본문·페이지) — 재적재 시 변경 여부 판단용"""
+    payload = "\x1f".join(
+        str(article.get(k) or "")
+        for k in ("article_number", "article_title", "article_text", "page_number")
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# ── 규정검색: 색인 ──────────────────────────────────────────────────────────
+# 조문 검색용 색인 2종. 모두 articles 의 변경을 같은 트랜잭션 안에서 반영하므로
+# upsert_document / insert_articles / delete_document 는 별도 처리 없이 동기화된다.
+#
+#   articles_fts    : unicode61 단어 색인 (word 모드, bm25 정렬)
+#   articles_tri    : trigram 색인 — 3자 이상 부분 문자열 (substring 모드)
+#
+# 한국어 규정 용어는 복합어(영업용순자본비율 ⊃ 순자본비율)라 단어 색인으로는
+# LIKE '%…%' 와 같은 결과를 낼 수 없다. substring 모드는 trigram 색인으로
+# 후보를 좁힌 뒤 원래의 LIKE 조건으로 다시 걸러 기존 검색과 결과 집합이 같다.
+#
+# 2자 이하 검색어는 색인 없이 LIKE 로 훑는다. 2-gram 역색인(articles_bigram)을
+# 두었으나 적재 시간을 약 4배로 늘리는 데 비해(600만 자 기준 12초 → 49초)
+# 아끼는 시간은 검색 1회당 수십 ms 이고, 그마저 검색 결과 캐시가 흡수한다.
+
+SEARCH_MODE_SUBSTRING = "substring"
+SEARCH_MODE_WORD      = "word"
+
+_FTS_SCHEMA = """
+    CREATE VIRTUAL TABLE articles_fts USING fts5(
+        article_text, article_title, article_number,
+        content='articles', content_rowid='id',
+        tokenize='unicode61'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_fts(rowid, article_text, article_title, article_number)
+        VALUES (new.id, new.article_text, new.article_title, new.article_number);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, article_text, article_title, article_number)
+        VALUES ('delete', old.id, old.article_text, old.article_title, old.article_number);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_fts_au
+    AFTER UPDATE OF article_text, article_title, article_number ON articles BEGIN
+        INSERT INTO articles_fts(articles_fts, rowid, article_text, article_title, article_number)
+        VALUES ('delete', old.id, old.article_text, old.article_title, old.article_number);
+        INSERT INTO articles_fts(rowid, article_text, article_title, article_number)
+        VALUES (new.id, new.article_text, new.article_title, new.article_number);
+    END;
+"""
+
+_TRIGRAM_SCHEMA = """
+    CREATE VIRTUAL TABLE articles_tri USING fts5(
+        article_text,
+        content='articles', content_rowid='id',
+        tokenize='trigram case_sensitive 0'
+    );
+
+    CREATE TRIGGER IF NOT EXISTS articles_tri_ai AFTER INSERT ON articles BEGIN
+        INSERT INTO articles_tri(rowid, article_text) VALUES (new.id, new.article_text);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_tri_ad AFTER DELETE ON articles BEGIN
+        INSERT INTO articles_tri(articles_tri, rowid, article_text)
+        VALUES ('delete', old.id, old.article_text);
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS articles_tri_au AFTER UPDATE OF article_text ON articles BEGIN
+        INSERT INTO articles_tri(articles_tri, rowid, article_text)
+        VALUES ('delete', old.id, old.article_text);
+        INSERT INTO articles_tri(rowid, article_text) VALUES (new.id, new.article_text);
+    END;
+"""
+
+
+# bm25 컬럼 가중치: 본문, 조문제목, 조문번호
+_FTS_BM25 = "bm25(articles_fts, 1.0, 4.0, 2.0)"
+
+
+def _table_exists(conn: sqlite3.Connection, name: str) -> bool:
+    return conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+    ).fetchone() is not None
+
+
+def _init_article_indexes(conn: sqlite3.Connection):
+    # 색인 도입 이전에 적재된 조문은 테이블 생성 시 일괄 색인
+    if not _table_exists(conn, "articles_fts"):
+        conn.executescript(_FTS_SCHEMA)
+        conn.execute("INSERT INTO articles_fts(articles_fts) VALUES ('rebuild')")
+    if not _table_exists(conn, "articles_tri"):
+        conn.executescript(_TRIGRAM_SCHEMA)
+        conn.execute("INSERT INTO articles_tri(articles_tri) VALUES ('rebuild')")
+    # 폐지한 2-gram 색인이 남아 있으면 제거 (트리거가 더는 등록하지 않는 UDF 를 호출한다)
+    if _table_exists(conn, "articles_bigram"):
+        conn.executescript("""
+            DROP TRIGGER IF EXISTS articles_bigram_ai;
+            DROP TRIGGER IF EXISTS articles_bigram_au;
+            DROP TABLE articles_bigram;
+        """)
+
+
+def _fts_query(keyword: str) -> str:
+    """검색어 → FTS5 MATCH 식 (공백 구분 토큰 AND, 토큰별 접두 일치)"""
+    terms = keyword.split()
+    return " ".join('"' + t.replace('"', '""') + '"*' for t in terms)
+
+
+def _match_clause(keyword: str, mode: str) -> tuple[str, str, list, str]:
+    """
+    검색 모드별 (FROM 절, WHERE 조건, 파라미터, 관련도 점수식) 반환.
+    점수식은 작을수록 관련도가 높다 (bm25 규약). 색인이 점수를 주지 않으면 0.0.
+
+    substring 모드는 항상 a.article_text LIKE '%검색어%' 로 재검증하므로
+    색인을 어떤 경로로 타든 기존 LIKE 검색과 결과 집합이 동일하다.
+    """
+    if mode == SEARCH_MODE_WORD:
+        return (
+            "articles_fts JOIN articles a ON a.id = articles_fts.rowid",
+            "articles_fts MATCH ?",
+            [_fts_query(keyword)],
+            _FTS_BM25,
+        )
+
+    like = f"%{keyword}%"
+    literal = "%" not in keyword and "_" not in keyword
+
+    if literal and len(keyword) >= 3:
+        # trigram 구문 일치 = 부분 문자열 일치, bm25 정렬 가능
+        phrase = '"' + keyword.replace('"', '""') + '"'
+        return (
+            "articles_tri JOIN articles a ON a.id = articles_tri.rowid",
+            "articles_tri MATCH ? AND a.article_text LIKE ?",
+            [phrase, like],
+            "bm25(articles_tri)",
+        )
+    if _longest_literal_run(keyword) >= 3:
+        # 와일드카드가 섞인 검색어: trigram 색인의 LIKE 지원으로 후보 축소.
+        # trigram 은 연속된 3자 이상의 리터럴 구간이 있어야 후보를 제대로 고른다
+        # ("순자_비율" 처럼 구간이 모두 2자 이하면 일치하는 행도 걸러 버린다).
+        return (
+            "articles a",
+            "a.id IN (SELECT rowid FROM articles_tri WHERE article_text LIKE ?)"
+            " AND a.article_text LIKE ?",
+            [like, like],
+            "0.0",
+        )
+    # 2자 이하 검색어 등 색인으로 좁힐 수 없는 경우
+    return "articles a", "a.article_text LIKE ?", [like], "0.0"
+
+
+def _longest_literal_run(keyword: str) -> int:
+    """LIKE 와일드카드(%, _)를 제외한 연속 리터럴 구간의 최대 길이"""
+    return max(len(run) for run in re.split(r"[%_]", keyword))
+
+
+# ── 규정검색: 코퍼스 버전 ───────────────────────────────────────────────────
+# 조문 집합이 바뀔 때마다 1씩 증가. 검색 결과 캐시(utils.search)의 키에 포함되어
+# 적재·삭제 직후의 검색이 이전 결과를 돌려주지 않도록 한다.
+# DB에 저장하므로 다른 프로세스(일괄 적재 등)의 변경도 반영된다.
+
+def _bump_corpus_version(conn: sqlite3.Connection):
+    conn.execute(
+        "UPDATE search_meta SET value = value + 1 WHERE key = 'corpus_version'"
+    )
+
+
+def get_corpus_version() -> int:
+    with get_conn() as conn:
+        row = conn.execute(
+            "SELECT value FROM search_meta WHERE key = 'corpus_version'"
+        ).fetchone()
+    return row["value"] if row else 0
+
+
+# ── 규정검색: PDF 파싱 캐시 ─────────────────────────────────────────────────
+# 업로드 PDF 내용(SHA-256)을 키로 파싱 결과(압축 직렬화)를 보관.
+# 파서 버전이 다른 항목은 저장 시 삭제되고, 총 크기가 한도를 넘으면
+# 가장 오래 사용되지 않은 항목부터 지운다.
+# 적중 시 last_used 는 _PARSE_CACHE_TOUCH 이상 지났을 때만 갱신하고, 다른 쓰기
+# (크롤링 적재 등)가 잠금을 잡고 있으면 건너뛴다 — 캐시 조회가 읽기로 끝나도록.
+
+_PARSE_CACHE_TOUCH = timedelta(hours=1)
+
+def get_parse_cache(content_key: str, parser_version: int) -> bytes | None:
+    with get_conn() as conn:
+        row = conn.execute(
+            "SELECT payload, last_used FROM parse_cache WHERE content_key = ? AND parser_version = ?",
+            (content_key, parser_version),
+        ).fetchone()
+        if row is None:
+            return None
+        now = datetime.now()
+        if str(row["last_used"] or "") < (now - _PARSE_CACHE_TOUCH).isoformat():
+            # 잠겨 있으면 기다리지 않고 건너뛴다
+            conn.execute("PRAGMA busy_timeout = 0")
+            try:
+                conn.execute(
+                    "UPDATE parse_cache SET last_used = ? WHERE content_key = ?",
+                    (now.isoformat(), content_key),
+                )
+            except sqlite3.OperationalError:
+                pass
+            finally:
+                conn.execute(f"PRAGMA busy_timeout = {_BUSY_TIMEOUT_MS}")
+    return row["payload"]
+
+
+def put_parse_cache(content_key: str, parser_version: int, payload: bytes, max_bytes: int):
+    if len(payload) > max_bytes:
+        return
+    with get_conn() as conn:
+        conn.execute("DELETE FROM parse_cache WHERE parser_version != ?", (parser_version,))
+        conn.execute("""
+            INSERT OR REPLACE INTO parse_cache (content_key, parser_version, payload, size, last_used)
+            VALUES (?, ?, ?, ?, ?)
+        """, (content_key, parser_version, payload, len(payload), datetime.now().isoformat()))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM parse_cache").fetchone()[0]
+        if total > max_bytes:
+            evict = []
+            for r in conn.execute(
+                "SELECT content_key, size FROM parse_cache WHERE content_key != ? ORDER BY last_used",
+                (content_key,),
+            ).fetchall():
+                if total <= max_bytes:
+                    break
+                evict.append((r["content_key"],))
+                total -= r["size"]
+            conn.executemany("DELETE FROM parse_cache WHERE content_key = ?", evict)
+
+
+# ── 규정검색: 법제처 API 응답 캐시 ──────────────────────────────────────────
+# (엔드포인트, 법령명, 종류)별 마지막 응답 원문(zlib 압축)과 해시·시행일.
+# 응답 해시가 같으면 파싱·적재를 건너뛴다. 적재된 문서가 삭제되면 함께 지워지므로
+# 다음 업데이트에서 다시 적재된다.
+
+def get_law_cache(endpoint: str, law_name: str, law_type: str) -> dict | None:
+    with get_conn() as conn:
+        row = conn.execute("""
+            SELECT doc_id, effective_date, content_hash, payload, fetched_at
+            FROM law_cache WHERE endpoint = ? AND law_name = ? AND law_type = ?
+        """, (endpoint, law_name, law_type)).fetchone()
+    return dict(row) if row else None
+
+
+def put_law_cache(
+    endpoint: str, law_name: str, law_type: str, doc_id: int,
+    effective_date: str | None, content_hash: str, payload: bytes,
+):
+    with get_conn() as conn:
+        conn.execute("""
+            INSERT OR REPLACE INTO law_cache
+                (endpoint, law_name, law_type, doc_id, effective_date, content_hash, payload, fetched_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, (
+            endpoint, law_name, law_type, doc_id, effective_date,
+            content_hash, payload, datetime.now().isoformat(),
+        ))
+
+
 # ── 규정검색: 문서 CRUD ──────────────────────────────────────────────────────
 
 def upsert_document(
     doc_name: str, doc_category: str, filename: str,
     enacted_date: str | None = None, source_type: str = "pdf",
+    replace_articles: bool = True,
 ) -> int:
+    """
+    문서 메타데이터 저장. 같은 문서명·분류가 있으면 갱신한다.
+
+    replace_articles=False 이면 기존 조문을 지우지 않는다 (sync_articles 로 증분 반영).
+    """
     with get_conn() as conn:
         row = conn.execute(
             "SELECT id FROM documents WHERE doc_name = ? AND doc_category = ?",
@@ -95,7 +526,8 @@ def upsert_document(
         ).fetchone()
         if row:
             doc_id = row["id"]
-            conn.execute("DELETE FROM articles WHERE doc_id = ?", (doc_id,))
+            if replace_articles:
+                conn.execute("DELETE FROM articles WHERE doc_id = ?", (doc_id,))
             conn.execute(
                 "UPDATE documents SET filename = ?, uploaded_at = ?, enacted_date = ?, source_type = ? WHERE id = ?",
                 (filename, datetime.now().isoformat(), enacted_date, source_type, doc_id),
@@ -106,6 +538,7 @@ def upsert_document(
                 (doc_name, doc_category, filename, enacted_date, source_type),
             )
             doc_id = cur.lastrowid
+        _bump_corpus_version(conn)
     return doc_id
 
 
@@ -117,12 +550,140 @@ def update_article_count(doc_id: int, count: int):
 
 
 def insert_articles(doc_id: int, articles: list[dict]):
+    """조문 일괄 저장. 화면 표시용 정규화 본문(display_text)도 이때 한 번만 계산한다."""
     with get_conn() as conn:
         conn.executemany(
-            """INSERT INTO articles (doc_id, article_number, article_title, article_text, page_number)
-               VALUES (:doc_id, :article_number, :article_title, :article_text, :page_number)""",
-            [{"doc_id": doc_id, **a} for a in articles],
+            """INSERT INTO articles
+                   (doc_id, article_number, article_title, article_text, page_number, display_text, content_hash)
+               VALUES
+                   (:doc_id, :article_number, :article_title, :article_text, :page_number, :display_text, :content_hash)""",
+            [_article_row(doc_id, a) for a in articles],
         )
+        _bump_corpus_version(conn)
+
+
+def _article_row(doc_id: int, article: dict) -> dict:
+    return {
+        "doc_id": doc_id,
+        **article,
+        "display_text": normalize_article_text(article["article_text"]),
+        "content_hash": _article_hash(article),
+    }
+
+
+def _article_key(article_number: str | None, seen: dict) -> tuple[str, int]:
+    """(조문번호, 같은 번호의 등장 순서) — 부칙 제1조처럼 번호가 반복되는 경우 구분"""
+    number = article_number or ""
+    n = seen.get(number, 0)
+    seen[number] = n + 1
+    return number, n
+
+
+_SYNC_BATCH = 500
+
+
+def sync_articles(doc_id: int, articles: Iterable[dict]) -> dict:
+    """
+    문서의 조문을 새 조문 목록과 비교하여 바뀐 것만 반영 (증분 재적재).
+
+    조문번호(반복 번호는 등장 순서)로 기존 조문과 짝지어 내용 해시가 같으면 그대로 두고,
+    다르면 같은 행(id 유지)을 갱신, 새 조문은 추가, 사라진 조문은 삭제한다.
+    articles 는 제너레이터여도 되며, 추가·갱신은 _SYNC_BATCH 건씩 모아 쓴다.
+
+    Returns: {"inserted": n, "updated": n, "deleted": n, "unchanged": n}
+    """
+    with get_conn() as conn:
+        existing: dict[tuple[str, int], tuple[int, str]] = {}
+        seen: dict = {}
+        for r in conn.execute(
+            "SELECT id, article_number, content_hash FROM articles WHERE doc_id = ? ORDER BY id",
+            (doc_id,),
+        ).fetchall():
+            existing[_article_key(r["article_number"], seen)] = (r["id"], r["content_hash"])
+
+        to_insert: list[dict] = []
+        to_update: list[dict] = []
+        inserted = updated = unchanged = 0
+
+        def flush():
+            if to_update:
+                conn.executemany(
+                    """UPDATE articles SET article_title = :article_title, article_text = :article_text,
+                           page_number = :page_number, display_text = :display_text,
+                           content_hash = :content_hash
+                       WHERE id = :id""",
+                    to_update,
+                )
+            if to_insert:
+                conn.executemany(
+                    """INSERT INTO articles
+                           (doc_id, article_number, article_title, article_text, page_number, display_text, content_hash)
+                       VALUES
+                           (:doc_id, :article_number, :article_title, :article_text, :page_number, :display_text, :content_hash)""",
+                    to_insert,
+                )
+            to_update.clear()
+            to_insert.clear()
+
+        seen = {}
+        for a in articles:
+            row = _article_row(doc_id, a)
+            old = existing.pop(_article_key(a["article_number"], seen), None)
+            if old is None:
+                to_insert.append(row)
+                inserted += 1
+            elif old[1] == row["content_hash"]:
+                unchanged += 1
+            else:
+                to_update.append({**row, "id": old[0]})
+                updated += 1
+            if len(to_insert) + len(to_update) >= _SYNC_BATCH:
+                flush()
+        flush()
+
+        stale_ids = [(article_id,) for article_id, _ in existing.values()]
+        if stale_ids:
+            conn.executemany("DELETE FROM articles WHERE id = ?", stale_ids)
+        if stale_ids or updated or inserted:
+            _bump_corpus_version(conn)
+
+    return {
+        "inserted": inserted,
+        "updated": updated,
+        "deleted": len(stale_ids),
+        "unchanged": unchanged,
+    }
+
+
+def ingest_document(
+    doc_name: str, doc_category: str, articles: Iterable[dict],
+    filename: str = "", enacted_date: str | None = None, source_type: str = "pdf",
+) -> dict:
+    """
+    문서 1건 적재 (메타데이터 upsert + 조문 증분 반영 + 조문 수 갱신).
+
+    전체가 하나의 트랜잭션이므로 중간에 실패하면 문서·조문·색인 모두 이전 상태로 남는다.
+    articles 는 제너레이터여도 된다 (크롤러의 스트리밍 파싱 결과를 그대로 흘려 넣음).
+
+    Returns: {"doc_id": id, "inserted": n, "updated": n, "deleted": n, "unchanged": n}
+    """
+    with transaction():
+        doc_id = upsert_document(
+            doc_name, doc_category, filename,
+            enacted_date, source_type=source_type, replace_articles=False,
+        )
+        diff = sync_articles(doc_id, articles)
+        update_article_count(doc_id, diff["inserted"] + diff["updated"] + diff["unchanged"])
+    return {"doc_id": doc_id, **diff}
+
+
+def ingest_documents(docs: list[dict]) -> list[dict]:
+    """
+    여러 문서를 한 번의 커밋으로 적재. 각 항목은 ingest_document 의 인자 dict.
+    하나라도 실패하면 전체가 롤백된다.
+    """
+    with transaction():
+        return [ingest_document(**doc) for doc in docs]
 
 
 def get_all_documents() -> list[dict]:
@@ -136,6 +697,7 @@ def get_all_documents() -> list[dict]:
 def delete_document(doc_id: int):
     with get_conn() as conn:
         conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+        _bump_corpus_version(conn)
 
 
 def get_document_by_id(doc_id: int) -> dict | None:
@@ -154,13 +716,23 @@ def get_articles_by_doc_id(doc_id: int) -> list[dict]:
     return [dict(r) for r in rows]
 
 
-def search_articles(keyword: str, categories: list[str] | None = None) -> list[dict]:
+def search_articles(
+    keyword: str, categories: list[str] | None = None,
+    mode: str = SEARCH_MODE_SUBSTRING,
+) -> list[dict]:
+    """
+    조문 검색.
+
+    mode:
+        "substring" — 부분 문자열 일치 (기존 LIKE '%검색어%' 와 동일한 결과, 색인 사용)
+        "word"      — 단어 단위 FTS5 검색 (토큰 접두 일치, bm25 관련도순)
+    """
     if not keyword.strip():
         return []
 
-    placeholders = ""
-    params: list = [f"%{keyword}%"]
+    from_sql, match_sql, params, rank = _match_clause(keyword, mode)
 
+    placeholders = ""
     if categories:
         ph = ",".join("?" * len(categories))
         placeholders = f" AND d.doc_category IN ({ph})"
@@ -168,17 +740,141 @@ def search_articles(keyword: str, categories: list[str] | None = None) -> list[d
 
     sql = f"""
         SELECT a.id, a.doc_id, a.article_number, a.article_title, a.article_text, a.page_number,
+               a.display_text,
                d.doc_name, d.doc_category, d.filename, d.source_type, d.enacted_date
-        FROM articles a
+        FROM {from_sql}
         JOIN documents d ON a.doc_id = d.id
-        WHERE a.article_text LIKE ?{placeholders}
-        ORDER BY d.doc_name, a.id
+        WHERE {match_sql}{placeholders}
+        ORDER BY {rank}, d.doc_name, a.id
     """
     with get_conn() as conn:
         rows = conn.execute(sql, params).fetchall()
     return [dict(r) for r in rows]
 
 
+# 결과 카드 스니펫: 첫 일치 위치 앞 30자부터 160자
+_SNIPPET_BEFORE = 30
+_SNIPPET_LEN    = 160
+
+
+def search_articles_page(
+    keyword: str, categories: list[str] | None = None,
+    mode: str = SEARCH_MODE_SUBSTRING,
+    after: list | None = None, limit: int = 10,
+) -> dict:
+    """
+    조문 검색 (서버 측 키셋 페이지네이션).
+
+    본문 전체 대신 스니펫(정규화된 display_text 의 일부)만 담은
+    한 페이지 분량의 가벼운 행을 반환한다.
+    전문은 get_article() 로 조문을 열 때만 읽는다.
+
+    Args:
+        after: 직전 페이지의 next_cursor (첫 페이지는 None)
+        limit: 페이지당 결과 수
+
+    Returns:
+        {
+            "total":       선택 분류 기준 전체 건수,
+            "facets":      {분류: 건수} (분류 필터와 무관한 전체 분포),
+            "rows":        [{id, doc_id, article_number, article_title, page_number,
+                             doc_name, doc_category, source_type, enacted_date,
+                             snippet, snippet_start, match_offset, match_len,
+                             text_len}, ...],
+            "next_cursor": 다음 페이지 커서 또는 None,
+        }
+    """
+    empty = {"total": 0, "facets": {}, "rows": [], "next_cursor": None}
+    if not keyword.strip():
+        return empty
+
+    from_sql, match_sql, match_params, rank = _match_clause(keyword, mode)
+
+    facet_sql = f"""
+        SELECT d.doc_category, COUNT(*) AS cnt
+        FROM {from_sql}
+        JOIN documents d ON a.doc_id = d.id
+        WHERE {match_sql}
+        GROUP BY d.doc_category
+    """
+
+    cat_sql = ""
+    cat_params: list = []
+    if categories:
+        cat_sql = f" AND d.doc_category IN ({','.join('?' * len(categories))})"
+        cat_params = list(categories)
+
+    cursor_sql = ""
+    cursor_params: list = []
+    if after:
+        cursor_sql = "WHERE (score, doc_name, id) > (?, ?, ?)"
+        cursor_params = list(after)
+
+    # 스니펫 기준 위치: 검색어(word 모드는 첫 토큰)의 첫 등장 위치.
+    # lower() 는 ASCII 만 접으므로 LIKE 의 대소문자 규칙과 같다.
+    # match_offset/match_len 은 스니펫 안에서의 일치 구간 (0부터, 없으면 -1/0).
+    probe = keyword.split()[0] if mode == SEARCH_MODE_WORD else keyword
+    page_sql = f"""
+        SELECT id, doc_id, article_number, article_title, page_number,
+               doc_name, doc_category, source_type, enacted_date, score,
+               substr(display_text, max(1, hit - {_SNIPPET_BEFORE}), {_SNIPPET_LEN}) AS snippet,
+               max(1, hit - {_SNIPPET_BEFORE}) AS snippet_start,
+               CASE WHEN hit > 0 THEN hit - max(1, hit - {_SNIPPET_BEFORE}) ELSE -1 END AS match_offset,
+               CASE WHEN hit > 0 THEN probe_len ELSE 0 END AS match_len,
+               length(display_text) AS text_len
+        FROM (
+            SELECT a.id, a.doc_id, a.article_number, a.article_title, a.page_number,
+                   a.display_text,
+                   d.doc_name, d.doc_category, d.source_type, d.enacted_date,
+                   {rank} AS score,
+                   instr(lower(a.display_text), lower(?)) AS hit,
+                   length(?) AS probe_len
+            FROM {from_sql}
+            JOIN documents d ON a.doc_id = d.id
+            WHERE {match_sql}{cat_sql}
+        )
+        {cursor_sql}
+        ORDER BY score, doc_name, id
+        LIMIT ?
+    """
+
+    with get_conn() as conn:
+        facets = {
+            r["doc_category"]: r["cnt"]
+            for r in conn.execute(facet_sql, match_params).fetchall()
+        }
+        rows = conn.execute(
+            page_sql, [probe, probe] + match_params + cat_params + cursor_params + [limit + 1],
+        ).fetchall()
+
+    rows = [dict(r) for r in rows]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = [last["score"], last["doc_name"], last["id"]]
+
+    total = sum(
+        cnt for cat, cnt in facets.items()
+        if not categories or cat in categories
+    )
+    return {"total": total, "facets": facets, "rows": rows, "next_cursor": next_cursor}
+
+
+def get_article(article_id: int) -> dict | None:
+    """조문 1건 + 소속 문서 정보 (보조 패널 전문 보기용)"""
+    with get_conn() as conn:
+        row = conn.execute("""
+            SELECT a.id, a.doc_id, a.article_number, a.article_title, a.article_text, a.page_number,
+                   a.display_text,
+                   d.doc_name, d.doc_category, d.filename, d.source_type, d.enacted_date
+            FROM articles a
+            JOIN documents d ON a.doc_id = d.id
+            WHERE a.id = ?
+        """, (article_id,)).fetchone()
+    return dict(row) if row else None
+
+
 # ── FSS 재무건전성 ───────────────────────────────────────────────────────────
 
 def save_fss_data(quarter: str, data_source: str, data_list: list[dict]):
@@ -280,6 +976,115 @@ def get_fss_update_log(limit: int = 20) -> list[dict]:
     return [dict(r) for r in rows]
 
 
+# ── 백그라운드 작업 ─────────────────────────────────────────────────────────
+# core.jobs 가 사용하는 작업 테이블. 같은 dedup_key 의 대기·실행 중 작업은
+# 부분 유니크 색인으로 최대 1건만 존재할 수 있다.
+
+_JOB_ACTIVE = ("queued", "running")
+
+
+def init_job_tables():
+    """백그라운드 작업 테이블 초기화"""
+    with get_conn() as conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                id          INTEGER PRIMARY KEY AUTOINCREMENT,
+                kind        TEXT NOT NULL,
+                params      TEXT NOT NULL,
+                dedup_key   TEXT NOT NULL,
+                status      TEXT NOT NULL DEFAULT 'queued',
+                progress    REAL NOT NULL DEFAULT 0,
+                message     TEXT,
+                result      TEXT,
+                error       TEXT,
+                owner       TEXT,
+                created_at  TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                started_at  TIMESTAMP,
+                finished_at TIMESTAMP
+            );
+
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_active
+                ON jobs(dedup_key) WHERE status IN ('queued', 'running');
+            CREATE INDEX IF NOT EXISTS idx_jobs_kind ON jobs(kind, id);
+        """)
+
+
+def create_job(kind: str, params: str, dedup_key: str, owner: str) -> tuple[int, bool]:
+    """
+    작업 등록. 같은 dedup_key 의 대기·실행 중 작업이 있으면 그 작업을 반환한다.
+
+    Returns: (job_id, created)
+    """
+    with transaction() as conn:
+        row = conn.execute(
+            "SELECT id FROM jobs WHERE dedup_key = ? AND status IN (?, ?)",
+            (dedup_key, *_JOB_ACTIVE),
+        ).fetchone()
+        if row:
+            return row["id"], False
+        cur = conn.execute(
+            "INSERT INTO jobs (kind, params, dedup_key, owner) VALUES (?, ?, ?, ?)",
+            (kind, params, dedup_key, owner),
+        )
+        return cur.lastrowid, True
+
+
+def start_job(job_id: int):
+    with get_conn() as conn:
+        conn.execute(
+            "UPDATE jobs SET status = 'running', started_at = ? WHERE id = ?",
+            (datetime.now().isoformat(), job_id),
+        )
+
+
+def set_job_progress(job_id: int, progress: float, message: str | None = None):
+    with get_conn() as conn:
+        conn.execute(
+            "UPDATE jobs SET progress = ?, message = COALESCE(?, message) WHERE id = ?",
+            (progress, message, job_id),
+        )
+
+
+def finish_job(job_id: int, status: str, result: str | None = None, error: str | None = None):
+    """status: 'success' | 'failed'"""
+    with get_conn() as conn:
+        conn.execute("""
+            UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?,
+                            progress = CASE WHEN ? = 'success' THEN 1 ELSE progress END
+            WHERE id = ?
+        """, (status, result, error, datetime.now().isoformat(), status, job_id))
+
+
+def fail_orphaned_jobs(owner: str, error: str) -> int:
+    """다른 소유자(이전 서버 프로세스)가 남긴 대기·실행 중 작업을 실패 처리"""
+    with get_conn() as conn:
+        cur = conn.execute("""
+            UPDATE jobs SET status = 'failed', error = ?, finished_at = ?
+            WHERE status IN (?, ?) AND (owner IS NULL OR owner != ?)
+        """, (error, datetime.now().isoformat(), *_JOB_ACTIVE, owner))
+    return cur.rowcount
+
+
+def get_job(job_id: int) -> dict | None:
+    with get_conn() as conn:
+        row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+    return dict(row) if row else None
+
+
+def get_jobs(kind: str | None = None, limit: int = 20) -> list[dict]:
+    """최근 작업 목록 (최신순)"""
+    with get_conn() as conn:
+        if kind:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE kind = ? ORDER BY id DESC LIMIT ?", (kind, limit)
+            ).fetchall()
+        else:
+            rows = conn.execute(
+                "SELECT * FROM jobs ORDER BY id DESC LIMIT ?", (limit,)
+            ).fetchall()
+    return [dict(r) for r in rows]
+
+
 # ── 손익집계 ─────────────────────────────────────────────────────────────────
 
 _PNL_DEFAULT_DIVISIONS = [
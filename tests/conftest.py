@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import db
+
+
+@pytest.fixture
+def temp_db(tmp_path, monkeypatch):
+    """임시 파일 DB 로 바꿔 init_db() 까지 마친 db 모듈"""
+    db.close_conn()
+    monkeypatch.setattr(db, "DB_PATH", tmp_path / "test.db")
+    db.init_db()
+    yield db
+    db.close_conn()
@@ -0,0 +1,72 @@
+"""schedule_ncr_data — 콜백 안의 오류가 회사 Future 로 전달되는지 (수집 작업이 멈추지 않도록)"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from api import fss_api
+
+COMPANY = {"finance_cd": "0001", "finance_nm": "테스트증권(주)"}
+GOOD = {
+    "SF408": [{"account_cd": "E", "a": "250.5"}, {"account_cd": "A1", "a": "100000000000"}],
+    "SF304": [{"account_cd": "L", "a": "100000000000"}],
+    "SF307": [{"account_cd": "J", "a": "500000000"}],
+    "SF308": [],
+}
+
+
+def _fake_fetch(responses: dict, last: str):
+    """last 목록은 나머지가 모두 도착한 뒤에 돌려준다"""
+    others_done = threading.Event()
+    arrived: set = set()
+
+    def fetch(session, finance_cd, list_no, start_mm, end_mm):
+        if list_no == last:
+            others_done.wait(5)
+            time.sleep(0.05)
+        rows = responses[list_no]
+        arrived.add(list_no)
+        if arrived >= {"SF408", "SF304", "SF307"} - {last}:
+            others_done.set()
+        return rows
+
+    return fetch
+
+
+def test_good_payload(monkeypatch):
+    monkeypatch.setattr(fss_api, "_fetch_list", _fake_fetch(GOOD, "SF408"))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        res = fss_api.schedule_ncr_data(executor, None, COMPANY, "202409", "202409").result(timeout=5)
+    assert res["metrics"]["ncr"] == 250.5
+    assert res["metrics"]["net_income_q"] == 5
+
+
+@pytest.mark.parametrize("bad_rows", [
+    [{"account_cd": "E", "a": "N/A"}],  # 숫자가 아닌 값
+    [{"a": "1"}],                       # account_cd 없음
+])
+def test_bad_payload_on_last_list_fails_future(monkeypatch, bad_rows):
+    monkeypatch.setattr(fss_api, "_fetch_list", _fake_fetch({**GOOD, "SF408": bad_rows}, "SF408"))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        done = fss_api.schedule_ncr_data(executor, None, COMPANY, "202409", "202409")
+        with pytest.raises((ValueError, KeyError)):
+            done.result(timeout=5)
+
+
+def test_fallback_submit_after_shutdown_fails_future(monkeypatch):
+    # SF408 이 비어 SF308 대체 조회가 필요하지만 그 사이 executor 가 종료된 경우
+    monkeypatch.setattr(fss_api, "_fetch_list", _fake_fetch({**GOOD, "SF408": []}, "SF408"))
+    executor = ThreadPoolExecutor(max_workers=3)
+    original_submit = executor.submit
+
+    def submit(fn, session, finance_cd, list_no, *args):
+        if list_no == "SF308":
+            raise RuntimeError("cannot schedule new futures after shutdown")
+        return original_submit(fn, session, finance_cd, list_no, *args)
+
+    monkeypatch.setattr(executor, "submit", submit)
+    done = fss_api.schedule_ncr_data(executor, None, COMPANY, "202409", "202409")
+    with pytest.raises(RuntimeError):
+        done.result(timeout=5)
+    executor.shutdown()
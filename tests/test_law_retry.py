@@ -0,0 +1,95 @@
+"""법제처 API 재시도(_get_with_retry) — 응답 순서를 지정하는 로컬 대역 서버로 확인"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+import requests
+
+from api import law_api
+
+BODY = "<법령><조문/></법령>".encode()
+
+
+class _ScriptedHandler(BaseHTTPRequestHandler):
+    """server.plan 에서 하나씩 꺼내 응답: 상태 코드, (상태, Retry-After) 또는 "drop" (응답 없이 끊기)"""
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests += 1
+        action = self.server.plan.pop(0) if self.server.plan else 200
+        if action == "drop":
+            self.close_connection = True
+            self.connection.shutdown(2)
+            return
+        status, retry_after = action if isinstance(action, tuple) else (action, None)
+        body = BODY if status == 200 else b""
+        self.send_response(status)
+        if retry_after is not None:
+            self.send_header("Retry-After", retry_after)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(monkeypatch):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _ScriptedHandler)
+    srv.plan, srv.requests = [], 0
+    srv.url = f"http://127.0.0.1:{srv.server_port}/law"
+    threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True).start()
+
+    srv.sleeps = []
+    monkeypatch.setattr(law_api, "_session", None)
+    monkeypatch.setattr(law_api, "_BACKOFF_BASE", 0.01)
+    monkeypatch.setattr(
+        law_api, "time", SimpleNamespace(perf_counter=time.perf_counter, sleep=srv.sleeps.append),
+    )
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+def _get(srv) -> bytes:
+    return law_api._get_with_retry(srv.url, {}, lambda resp: resp.content, timeout=5)
+
+
+def test_retries_503_then_succeeds(server):
+    server.plan = [503, 503]
+    assert _get(server) == BODY
+    assert server.requests == 3
+    assert len(server.sleeps) == 2
+    assert all(0 <= s <= 0.01 * 2 ** i for i, s in enumerate(server.sleeps))
+
+
+def test_429_honours_retry_after(server):
+    server.plan = [(429, "3")]
+    assert _get(server) == BODY
+    assert server.requests == 2
+    assert server.sleeps == [3.0]
+
+
+def test_dropped_connection_is_retried(server):
+    server.plan = ["drop"]
+    assert _get(server) == BODY
+    assert server.requests == 2
+
+
+def test_exhausted_retries_raise_http_error(server):
+    server.plan = [503] * (law_api._MAX_RETRIES + 1)
+    with pytest.raises(requests.HTTPError):
+        _get(server)
+    assert server.requests == law_api._MAX_RETRIES + 1
+    assert len(server.sleeps) == law_api._MAX_RETRIES
+
+
+def test_404_is_not_retried(server):
+    server.plan = [404]
+    with pytest.raises(requests.HTTPError):
+        _get(server)
+    assert server.requests == 1
+    assert server.sleeps == []
@@ -0,0 +1,86 @@
+"""저메모리 PDF 파싱(low_memory=True)의 최대 RSS 상한과 쪽수 무관성"""
+import io
+import multiprocessing
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+resource = pytest.importorskip("resource")
+
+PAGES = 60
+# 측정치 (60쪽 합성 규정): 기본 모드 약 240 MB, low_memory 약 13 MB
+RSS_CEILING_MB = 40
+
+# 쪽수 무관성: 텍스트 쪽 200쪽 → 2000쪽에서 허용하는 RSS 증가 차이.
+# 쪽 텍스트를 모두 보관하면 1800쪽 × 4000자 ≈ 15 MB 이상 늘어난다.
+FLAT_PAGES = (200, 2000)
+FLAT_TOLERANCE_MB = 5
+_PAGE_LINES, _LINE_CHARS = 40, 100
+
+
+def _maxrss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024 if sys.platform == "darwin" else 1024)  # macOS 는 바이트, Linux 는 KB
+
+
+def _parse_pdf_growth_mb(pdf_path: str) -> float:
+    """새 프로세스에서 PDF 파싱 — 모듈 임포트·PDF 읽기 이후 기준 ru_maxrss 증가량(MB)"""
+    from utils.parser import parse_pdf_document
+
+    with open(pdf_path, "rb") as f:
+        data = f.read()
+    before = _maxrss_mb()
+    parsed = parse_pdf_document(io.BytesIO(data), use_cache=False, workers=1, low_memory=True)
+    assert parsed["articles"]
+    return _maxrss_mb() - before
+
+
+def _synthetic_pages(data: bytes):
+    """쪽마다 서로 다른 한글 본문 4000자 (조문 머리 없음), 마지막 쪽에 부칙·시행일"""
+    n_pages = int(data)
+    for page in range(1, n_pages + 1):
+        lines = [
+            "".join(chr(0xAC00 + (page * 7919 + line * 131 + i) % 11172) for i in range(_LINE_CHARS))
+            for line in range(_PAGE_LINES)
+        ]
+        if page == n_pages:
+            lines.append("부칙\n이 규정은 2024년 3월 1일부터 시행한다.")
+        yield page, "\n".join(lines)
+
+
+def _parse_synthetic_growth_mb(n_pages: int) -> float:
+    """새 프로세스에서 합성 쪽 n_pages 개를 저메모리 파싱 — ru_maxrss 증가량(MB)"""
+    from utils import parser
+
+    parser.register_backend("synthetic", lambda data: int(data), None, iter_pages=_synthetic_pages)
+    before = _maxrss_mb()
+    parsed = parser.parse_pdf_document(
+        io.BytesIO(str(n_pages).encode()), use_cache=False, backend="synthetic", low_memory=True,
+    )
+    assert parsed["page_count"] == n_pages
+    assert parsed["char_count"] > n_pages * _PAGE_LINES * _LINE_CHARS
+    assert parsed["enacted_date"] == "2024-03-01"
+    return _maxrss_mb() - before
+
+
+def _in_spawned_process(fn, *args) -> float:
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+        return pool.submit(fn, *args).result()
+
+
+def test_low_memory_parse_rss_ceiling(tmp_path):
+    pytest.importorskip("reportlab")
+    from tools import gen_corpus
+
+    [pdf_path] = gen_corpus.generate(tmp_path, docs=1, pages=PAGES, articles=150, seed=3)
+    growth = _in_spawned_process(_parse_pdf_growth_mb, str(pdf_path))
+    assert growth < RSS_CEILING_MB, f"low_memory 파싱 RSS 증가 {growth:.1f} MB"
+
+
+def test_low_memory_parse_rss_flat_in_page_count():
+    small, large = (_in_spawned_process(_parse_synthetic_growth_mb, n) for n in FLAT_PAGES)
+    assert large - small < FLAT_TOLERANCE_MB, (
+        f"{FLAT_PAGES[0]}쪽 {small:.1f} MB → {FLAT_PAGES[1]}쪽 {large:.1f} MB"
+    )
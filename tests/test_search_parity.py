@@ -0,0 +1,69 @@
+"""substring 검색이 어떤 색인 경로를 타든 LIKE '%검색어%' 와 같은 결과를 내는지 확인"""
+import random
+
+import db
+
+_WORDS = [
+    "영업용순자본비율", "순자본", "산정 VaR", "VaR", "var", "Stress Test", "위험액",
+    "신용위험", "시장위험", "운영위험", "100%", "a_b", "파생상품", "금융투자업", "제3조",
+    "자본_율", "ABC", "abc", "xY", "Xy", "비율", "산정", "한도", "보고",
+]
+_EXTRA = "%_aAbBvVrR "
+
+
+def _corpus(rng: random.Random, n: int) -> list[dict]:
+    articles = []
+    for i in range(n):
+        text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(3, 12)))
+        if rng.random() < 0.3:
+            text = text.replace(" ", "")
+        articles.append({
+            "article_number": f"제{i + 1}조",
+            "article_title": "",
+            "article_text": text,
+            "page_number": 1,
+        })
+    return articles
+
+
+def _queries(rng: random.Random, texts: list[str], n: int) -> list[str]:
+    alphabet = sorted(set("".join(texts)) | set(_EXTRA))
+    queries = []
+    for _ in range(n):
+        size = rng.randint(1, 5)
+        if rng.random() < 0.5:
+            # 실제 본문 조각에 와일드카드·대소문자 변형을 섞어 일치하는 검색어도 고르게 만든다
+            text = rng.choice(texts)
+            start = rng.randrange(max(1, len(text) - size + 1))
+            chars = list(text[start:start + size])
+            for j, c in enumerate(chars):
+                r = rng.random()
+                if r < 0.15:
+                    chars[j] = rng.choice("%_")
+                elif r < 0.3:
+                    chars[j] = c.swapcase()
+            q = "".join(chars)
+        else:
+            q = "".join(rng.choice(alphabet) for _ in range(size))
+        if q.strip():
+            queries.append(q)
+    return queries
+
+
+def test_substring_search_matches_like(temp_db):
+    rng = random.Random(20240901)
+    articles = _corpus(rng, 400)
+    db.ingest_document("패리티 규정", "내규", articles)
+    texts = [a["article_text"] for a in articles]
+
+    with db.get_conn() as conn:
+        def like_ids(q: str) -> set[int]:
+            rows = conn.execute(
+                "SELECT id FROM articles WHERE article_text LIKE ?", (f"%{q}%",),
+            ).fetchall()
+            return {r["id"] for r in rows}
+
+        fixed = ["순자_비율", "자본_율", "산정%v", "VaR", "va", "%", "_", "a_", "비율"]
+        for q in fixed + _queries(rng, texts, 1500):
+            got = {r["id"] for r in db.search_articles(q)}
+            assert got == like_ids(q), q
@@ -0,0 +1,108 @@
+"""
+FISIS 수집기·법령 크롤러 처리량 벤치마크 (tools.mock_api 로컬 대역 서버 대상).
+
+    python -m tools.bench_api --latency-ms 80 --error-rate 0.02
+    python -m tools.bench_api --base http://127.0.0.1:8765 --extra-laws 20   # 따로 띄운 서버 사용
+
+1) collect_all_securities_data(분기) — 증권사 목록 + 회사별 통계 조회
+2) crawl_single_law × 관리 법령 (crawl_laws 로 동시 실행) — --rounds 2 이상이면
+   두 번째부터는 응답 캐시로 변경 없음 처리되는 경로를 측정한다.
+
+단계별 소요 시간, 서버가 받은 요청 수·초당 요청 수, 상태 코드별 건수를 보고한다.
+적재는 임시 DB(--db 로 지정 가능)에 하므로 운영 DB 에 영향이 없다.
+"""
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import db
+from api import fss_api, law_api
+from tools.mock_api import FSS_PREFIX, LAW_PREFIX, add_fault_arguments, server_from_args
+
+
+def _measure(label: str, server, fn) -> dict:
+    before = server.stats() if server else None
+    started = time.perf_counter()
+    outcome = fn()
+    elapsed = time.perf_counter() - started
+    row = {"label": label, "elapsed": elapsed, "outcome": outcome}
+    if server:
+        after = server.stats()
+        row["requests"] = after["requests"] - before["requests"]
+        row["by_status"] = {
+            code: n - before["by_status"].get(code, 0)
+            for code, n in after["by_status"].items()
+            if n - before["by_status"].get(code, 0)
+        }
+        row["rps"] = row["requests"] / elapsed if elapsed else 0.0
+    return row
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="FISIS·법제처 API 클라이언트 벤치마크 (로컬 대역 서버)")
+    ap.add_argument("--base", default=None, help="이미 떠 있는 tools.mock_api 서버 주소 (없으면 내장 서버 기동)")
+    ap.add_argument("--quarter", default="2024Q3")
+    ap.add_argument("--extra-laws", type=int, default=0, help="관리 법령 외에 추가할 가상 법령 수")
+    ap.add_argument("--law-workers", type=int, default=None, help="법령 동시 크롤링 수 (기본: 설정값)")
+    ap.add_argument("--rounds", type=int, default=2, help="법령 크롤링 반복 횟수")
+    ap.add_argument("--db", type=Path, default=None, help="적재용 DB 경로 (기본: 임시 파일)")
+    add_fault_arguments(ap)
+    args = ap.parse_args(argv)
+
+    server = None
+    if args.base:
+        base = args.base.rstrip("/")
+    else:
+        server = server_from_args(args).start()
+        base = server.base_url
+    fss_api.FSS_API_BASE = base + FSS_PREFIX
+    law_api.LAW_API_BASE = base + LAW_PREFIX
+    law_api.LAW_API_KEY = law_api.LAW_API_KEY or "mock"
+
+    db.DB_PATH = args.db or Path(tempfile.mkdtemp(prefix="bench_api_")) / "bench.db"
+    db.init_db()
+
+    laws = list(law_api.MANAGED_LAWS) + [
+        {"name": f"가상법령 {i + 1}", "category": "법령", "type": "law"}
+        for i in range(args.extra_laws)
+    ]
+
+    print(f"대상 서버 {base} · DB {db.DB_PATH}\n")
+    rows = []
+    rows.append(_measure(
+        f"FISIS 수집 {args.quarter}", server,
+        lambda: f"{len(fss_api.collect_all_securities_data(args.quarter))}개 회사",
+    ))
+
+    def crawl() -> str:
+        results = [ok for _, ok, _ in law_api.crawl_laws(laws, max_workers=args.law_workers)]
+        return f"{sum(results)}/{len(results)}건 성공"
+
+    for i in range(max(1, args.rounds)):
+        rows.append(_measure(f"법령 크롤링 {i + 1}회차 ({len(laws)}건)", server, crawl))
+
+    print(f"{'단계':<30}{'초':>8}{'요청':>8}{'요청/s':>9}  결과")
+    for r in rows:
+        print(
+            f"{r['label']:<30}{r['elapsed']:>8.2f}{r.get('requests', '-'):>8}"
+            f"{r.get('rps', 0):>9.1f}  {r['outcome']}"
+            + (f"  {r['by_status']}" if r.get("by_status") else "")
+        )
+
+    stats = law_api.latency_stats()
+    if stats["requests"]:
+        print(
+            f"\n법령 API 지연 (시도 {stats['requests']}건 · 재시도 {stats['retries']}건 · 오류 {stats['errors']}건): "
+            f"p50 {stats['p50'] * 1000:.0f}ms · p95 {stats['p95'] * 1000:.0f}ms · 최대 {stats['max'] * 1000:.0f}ms"
+        )
+    if server:
+        server.stop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+PDF 텍스트 추출 백엔드 벤치마크.
+
+샘플 PDF 폴더(또는 단일 파일)를 백엔드별로 추출하여 비교한다.
+    python -m tools.bench_extract ./샘플규정 [--backend pdfplumber --backend pymupdf]
+
+백엔드마다 새 프로세스에서 실행하여 최대 메모리(RSS)가 서로 섞이지 않게 하며,
+쪽/초, 최대 RSS, parse_articles 가 인식한 조문 수를 보고한다.
+"""
+import argparse
+import io
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from utils.parser import available_backends, extract_text_by_page, parse_articles
+
+
+def _rss_mb() -> float:
+    # 리눅스 ru_maxrss 단위는 KiB (macOS 는 바이트)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def _run_backend(backend: str, files: list[str]) -> dict:
+    """워커 프로세스: 한 백엔드로 모든 파일 추출·파싱"""
+    baseline = _rss_mb()
+    pages = articles = 0
+    failed: list[str] = []
+    started = time.perf_counter()
+    for path in files:
+        data = Path(path).read_bytes()
+        try:
+            page_texts = extract_text_by_page(io.BytesIO(data), workers=1, backend=backend)
+        except ValueError as e:
+            failed.append(f"{Path(path).name}: {e}")
+            continue
+        pages += len(page_texts)
+        articles += len(parse_articles(page_texts))
+    elapsed = time.perf_counter() - started
+    return {
+        "backend": backend,
+        "pages": pages,
+        "articles": articles,
+        "elapsed": elapsed,
+        "pages_per_sec": pages / elapsed if elapsed else 0.0,
+        "peak_rss_mb": _rss_mb(),
+        "rss_growth_mb": _rss_mb() - baseline,
+        "failed": failed,
+    }
+
+
+def benchmark(files: list[str], backends: list[str]) -> list[dict]:
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for backend in backends:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(_run_backend, (backend, files)))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="PDF 텍스트 추출 백엔드 벤치마크")
+    ap.add_argument("path", type=Path, help="샘플 PDF 폴더 또는 파일")
+    ap.add_argument(
+        "--backend", action="append", choices=available_backends(),
+        help="비교할 백엔드 (기본: 설치된 전체)",
+    )
+    args = ap.parse_args(argv)
+
+    if args.path.is_dir():
+        files = sorted(str(p) for p in args.path.rglob("*.pdf"))
+    else:
+        files = [str(args.path)]
+    if not files:
+        ap.error(f"PDF 파일이 없습니다: {args.path}")
+
+    backends = args.backend or available_backends()
+    print(f"샘플 {len(files)}개 파일 · 백엔드 {', '.join(backends)}\n")
+    print(f"{'백엔드':<12}{'쪽':>8}{'초':>9}{'쪽/초':>10}{'최대RSS(MB)':>13}{'증가(MB)':>10}{'조문':>8}")
+    for r in benchmark(files, backends):
+        print(
+            f"{r['backend']:<12}{r['pages']:>8}{r['elapsed']:>9.2f}{r['pages_per_sec']:>10.1f}"
+            f"{r['peak_rss_mb']:>13.1f}{r['rss_growth_mb']:>10.1f}{r['articles']:>8}"
+        )
+        for failure in r["failed"]:
+            print(f"    ✗ {failure}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
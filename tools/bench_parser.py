@@ -0,0 +1,174 @@
+"""
+조문 파서 벤치마크 + 정확도 회귀 검사.
+
+    python -m tools.bench_parser ./corpus                     # 기존 코퍼스 (tools.gen_corpus)
+    python -m tools.bench_parser --generate --sizes 20x60 200x600
+    python -m tools.bench_parser ./corpus --json result.json  # 결과 기록 (변경 전후 비교용)
+
+문서마다 새 프로세스에서 텍스트 추출 → parse_articles / find_enacted_date 를 실행하고
+추출 시간, 파싱 시간(--repeat 회 중 최솟값), 최대 RSS, 정답 대비 정확도를 보고한다.
+ARTICLE_PATTERN·TOC_PATTERN·iter_articles 를 바꿀 때 속도와 정확도를 함께 확인하는 용도.
+"""
+import argparse
+import io
+import json
+import multiprocessing
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tools.gen_corpus import generate, truth_path
+from utils.parser import extract_text_by_page, find_enacted_date, parse_articles
+
+
+def _rss_mb() -> float:
+    # 리눅스 ru_maxrss 단위는 KiB (macOS 는 바이트)
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+
+
+def score(parsed: list[dict], truth: list[dict]) -> dict:
+    """
+    조문 번호 기준 정밀도·재현율 (같은 번호가 여러 번 나오면 횟수까지 비교)
+    + 순서대로 짝지은 조문의 제목·시작 쪽 일치율.
+    """
+    expected: dict[str, int] = {}
+    for art in truth:
+        expected[art["article_number"]] = expected.get(art["article_number"], 0) + 1
+    found: dict[str, int] = {}
+    for art in parsed:
+        found[art["article_number"]] = found.get(art["article_number"], 0) + 1
+    matched = sum(min(n, found.get(k, 0)) for k, n in expected.items())
+
+    by_number = {}
+    for art in parsed:
+        by_number.setdefault(art["article_number"], []).append(art)
+    title_ok = page_ok = 0
+    for art in truth:
+        candidates = by_number.get(art["article_number"])
+        if not candidates:
+            continue
+        got = candidates.pop(0)
+        title_ok += got.get("article_title") == art["article_title"]
+        page_ok += got.get("page_number") == art["page_number"]
+
+    return {
+        "precision": matched / len(parsed) if parsed else 0.0,
+        "recall": matched / len(truth) if truth else 1.0,
+        "title_accuracy": title_ok / matched if matched else 0.0,
+        "page_accuracy": page_ok / matched if matched else 0.0,
+        "missing": sorted(k for k, n in expected.items() if found.get(k, 0) < n),
+        "extra": sorted(k for k, n in found.items() if n > expected.get(k, 0)),
+    }
+
+
+def _run_document(pdf_path: str, repeat: int) -> dict:
+    """워커 프로세스: 문서 하나 추출·파싱·채점"""
+    truth = json.loads(truth_path(Path(pdf_path)).read_text(encoding="utf-8"))
+    data = Path(pdf_path).read_bytes()
+    baseline = _rss_mb()
+
+    started = time.perf_counter()
+    pages = extract_text_by_page(io.BytesIO(data), workers=1)
+    extract_sec = time.perf_counter() - started
+
+    parse_sec = float("inf")
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        articles = parse_articles(pages)
+        enacted_date = find_enacted_date(pages)
+        parse_sec = min(parse_sec, time.perf_counter() - started)
+
+    result = score(articles, truth["articles"])
+    result.update({
+        "document": Path(pdf_path).name,
+        "pages": len(pages),
+        "articles": len(articles),
+        "expected_articles": len(truth["articles"]),
+        "enacted_ok": enacted_date == truth["enacted_date"],
+        "extract_sec": extract_sec,
+        "parse_sec": parse_sec,
+        "peak_rss_mb": _rss_mb(),
+        "rss_growth_mb": _rss_mb() - baseline,
+    })
+    return result
+
+
+def benchmark(files: list[str], repeat: int = 3) -> list[dict]:
+    ctx = multiprocessing.get_context("spawn")
+    results = []
+    for path in files:
+        with ctx.Pool(1) as pool:
+            results.append(pool.apply(_run_document, (path, repeat)))
+    return results
+
+
+def _parse_size(value: str) -> tuple[int, int]:
+    pages, sep, articles = value.partition("x")
+    if not sep or not pages.isdigit() or not articles.isdigit():
+        raise argparse.ArgumentTypeError(f"크기 형식 오류 (쪽x조문, 예: 50x150): {value}")
+    return int(pages), int(articles)
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="조문 파서 벤치마크 (합성 코퍼스 정답 비교)")
+    ap.add_argument("path", type=Path, nargs="?", help="코퍼스 폴더 (tools.gen_corpus 출력)")
+    ap.add_argument("--generate", action="store_true", help="임시 폴더에 코퍼스를 새로 생성")
+    ap.add_argument(
+        "--sizes", nargs="+", type=_parse_size, default=[(20, 60), (100, 300)],
+        metavar="쪽x조문", help="--generate 시 문서 크기 (기본: 20x60 100x300)",
+    )
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--repeat", type=int, default=3, help="파싱 반복 횟수 (최솟값 보고)")
+    ap.add_argument("--json", type=Path, help="결과를 JSON 으로 저장")
+    args = ap.parse_args(argv)
+
+    if args.generate:
+        out_dir = args.path or Path(tempfile.mkdtemp(prefix="parser_corpus_"))
+        for pages, articles in args.sizes:
+            generate(out_dir, 1, pages, articles, seed=args.seed)
+    elif args.path is None:
+        ap.error("코퍼스 폴더를 지정하거나 --generate 를 사용하세요.")
+    else:
+        out_dir = args.path
+
+    files = sorted(
+        str(p) for p in out_dir.glob("*.pdf") if truth_path(p).exists()
+    )
+    if not files:
+        ap.error(f"정답 파일(.truth.json)이 있는 PDF 가 없습니다: {out_dir}")
+
+    print(f"코퍼스 {out_dir} · {len(files)}개 문서\n")
+    print(
+        f"{'문서':<32}{'쪽':>6}{'조문':>11}{'추출(s)':>9}{'파싱(ms)':>10}"
+        f"{'RSS(MB)':>9}{'정밀도':>8}{'재현율':>8}{'제목':>7}{'쪽':>7}{'시행일':>6}"
+    )
+    results = benchmark(files, args.repeat)
+    failed = 0
+    for r in results:
+        print(
+            f"{r['document'][:31]:<32}{r['pages']:>6}"
+            f"{r['articles']:>5}/{r['expected_articles']:<5}"
+            f"{r['extract_sec']:>9.2f}{r['parse_sec'] * 1000:>10.1f}{r['peak_rss_mb']:>9.1f}"
+            f"{r['precision']:>8.3f}{r['recall']:>8.3f}"
+            f"{r['title_accuracy']:>7.3f}{r['page_accuracy']:>7.3f}"
+            f"{'O' if r['enacted_ok'] else 'X':>6}"
+        )
+        if r["missing"]:
+            print(f"    누락: {', '.join(r['missing'][:10])}{' …' if len(r['missing']) > 10 else ''}")
+        if r["extra"]:
+            print(f"    초과: {', '.join(r['extra'][:10])}{' …' if len(r['extra']) > 10 else ''}")
+        if r["missing"] or r["extra"] or not r["enacted_ok"]:
+            failed += 1
+
+    if args.json:
+        args.json.write_text(json.dumps(results, ensure_ascii=False, indent=1), encoding="utf-8")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
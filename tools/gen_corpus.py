@@ -0,0 +1,256 @@
+"""
+합성 규정 PDF 생성기 (파서 회귀 코퍼스용).
+
+    python -m tools.gen_corpus ./corpus --docs 5 --pages 40 --articles 120 --seed 1
+
+문서마다 <이름>.pdf 와 정답 <이름>.truth.json 을 쓴다. 생성되는 PDF 구성:
+- 목차 (제X조(제목) ...... 쪽) — 파서가 목차로 걸러내야 하는 줄
+- 장 제목 + 본문 조문 (제X조, 일부는 제X조의Y), ①② 항과 1. 2. 호
+- 부칙 (공포일·시행일)
+
+정답에는 조문 번호·제목·시작 쪽과 시행일이 들어 있어
+tools.bench_parser 가 파싱 결과의 정확도를 비교한다.
+reportlab 이 필요하다 (선택 의존성: pip install reportlab).
+"""
+import argparse
+import json
+import random
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+FONT_NAME = "HYSMyeongJo-Medium"
+FONT_SIZE = 10
+LINE_HEIGHT = 15
+PAGE_WIDTH, PAGE_HEIGHT = 595, 842       # A4 (pt)
+MARGIN_X, MARGIN_TOP, MARGIN_BOTTOM = 60, 60, 60
+# 한글 1자 ≈ 글꼴 크기 폭 — 줄 나눔 기준
+LINE_CHARS = (PAGE_WIDTH - 2 * MARGIN_X) // FONT_SIZE
+LINES_PER_PAGE = (PAGE_HEIGHT - MARGIN_TOP - MARGIN_BOTTOM) // LINE_HEIGHT
+
+CIRCLED = "①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮"
+
+TITLES = [
+    "목적", "정의", "적용범위", "순자본비율의 산정", "영업용순자본", "총위험액의 산정",
+    "시장위험액", "신용위험액", "운영위험액", "보고 및 공시", "내부통제기준", "위험관리위원회",
+    "위험관리책임자", "한도의 설정", "한도초과 시 조치", "자료의 보관", "업무의 위임",
+    "검사 및 제재", "시행세칙", "재검토기한",
+]
+SUBJECTS = ["회사는", "위험관리책임자는", "대표이사는", "감사위원회는", "각 부서의 장은", "금융감독원장은"]
+OBJECTS = [
+    "순자본비율을 매 분기 말 기준으로 산정하여", "총위험액과 영업용순자본을 비교하여",
+    "위험한도의 준수 여부를 점검하여", "내부통제기준의 운영 실태를", "신용위험 노출액을 거래상대방별로",
+    "시장위험액 산정에 필요한 자료를", "자본적정성 평가 결과를", "한도 초과 사실과 그 사유를",
+]
+PREDICATES = [
+    "이사회에 보고하여야 한다.", "지체 없이 금융감독원장에게 제출하여야 한다.",
+    "5년 이상 보관하여야 한다.", "별표에서 정하는 방법에 따라 관리한다.",
+    "필요한 조치를 하여야 한다.", "위원회의 심의를 거쳐 정한다.",
+]
+CHAPTERS = ["총칙", "자본적정성", "위험관리", "보고 및 공시", "보칙"]
+
+
+# ── 문서 명세 (정답 포함) ─────────────────────────────────────────────────────
+
+def _sentence(rng: random.Random) -> str:
+    return f"{rng.choice(SUBJECTS)} {rng.choice(OBJECTS)} {rng.choice(PREDICATES)}"
+
+
+def _article_numbers(n_articles: int, rng: random.Random, branch_ratio: float) -> list[str]:
+    """제1조, 제2조, 제2조의2 ... — 가지 조문(제X조의Y)은 branch_ratio 비율로 섞는다"""
+    numbers: list[str] = []
+    base = 0
+    while len(numbers) < n_articles:
+        if numbers and rng.random() < branch_ratio:
+            branch = 2
+            while len(numbers) < n_articles:
+                numbers.append(f"제{base}조의{branch}")
+                branch += 1
+                if rng.random() < 0.7:
+                    break
+        else:
+            base += 1
+            numbers.append(f"제{base}조")
+    return numbers
+
+
+def build_spec(
+    n_articles: int, pages: int, seed: int = 0, branch_ratio: float = 0.1,
+    name: str = "합성규정",
+) -> dict:
+    """
+    조문 구성과 정답을 만든다 (렌더링 전 — 쪽 번호는 render_pdf 가 채운다).
+
+    조문당 항 수는 본문이 대략 pages 쪽을 채우도록 정한다.
+    """
+    rng = random.Random(seed)
+    numbers = _article_numbers(n_articles, rng, branch_ratio)
+    toc_lines = n_articles + 2
+    toc_pages = -(-toc_lines // LINES_PER_PAGE)
+    body_lines = max(1, pages - toc_pages) * LINES_PER_PAGE
+    # 조문 머리 1줄 + 항당 평균 약 2.5줄 (문장 2개 ≈ 80자)
+    paragraphs = max(1, min(len(CIRCLED), round((body_lines / n_articles - 1) / 2.5)))
+
+    articles = []
+    for i, number in enumerate(numbers):
+        n_par = max(1, paragraphs + rng.randint(-1, 1))
+        pars = []
+        for k in range(min(n_par, len(CIRCLED))):
+            text = f"{CIRCLED[k]} {_sentence(rng)} {_sentence(rng)}"
+            items = []
+            if rng.random() < 0.2:
+                items = [f"{j}. {rng.choice(OBJECTS)} 정리한 사항" for j in range(1, rng.randint(2, 4))]
+            pars.append({"text": text, "items": items})
+        articles.append({
+            "article_number": number,
+            "article_title": TITLES[i % len(TITLES)],
+            "chapter": i * len(CHAPTERS) // n_articles,
+            "paragraphs": pars,
+        })
+
+    promulgated = date(2015, 1, 1) + timedelta(days=rng.randint(0, 3650))
+    enacted = promulgated + timedelta(days=rng.randint(0, 180))
+    return {
+        "name": name,
+        "seed": seed,
+        "articles": articles,
+        "promulgated_date": promulgated.isoformat(),
+        "enacted_date": enacted.isoformat(),
+    }
+
+
+# ── PDF 렌더링 ──────────────────────────────────────────────────────────────
+
+def _wrap(text: str, width: int = LINE_CHARS) -> list[str]:
+    return [text[i:i + width] for i in range(0, len(text), width)] or [""]
+
+
+def render_pdf(spec: dict, out) -> dict:
+    """
+    spec 을 PDF 로 렌더링 (out: 경로 또는 바이너리 파일 객체) → 정답 dict.
+
+    정답: {"name", "page_count", "enacted_date",
+           "articles": [{"article_number", "article_title", "page_number"}, ...]}
+    """
+    try:
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+        from reportlab.pdfgen import canvas
+    except ImportError as e:
+        raise RuntimeError("reportlab 패키지가 필요합니다: pip install reportlab") from e
+
+    if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+        pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+
+    c = canvas.Canvas(out if isinstance(out, str) else out, pagesize=(PAGE_WIDTH, PAGE_HEIGHT))
+    state = {"page": 1, "y": PAGE_HEIGHT - MARGIN_TOP}
+
+    def new_page():
+        c.showPage()
+        state["page"] += 1
+        state["y"] = PAGE_HEIGHT - MARGIN_TOP
+
+    def line(text: str, indent: int = 0):
+        if state["y"] < MARGIN_BOTTOM:
+            new_page()
+        c.setFont(FONT_NAME, FONT_SIZE)
+        c.drawString(MARGIN_X + indent, state["y"], text)
+        state["y"] -= LINE_HEIGHT
+
+    def blank():
+        state["y"] -= LINE_HEIGHT
+
+    # 목차 — 쪽 번호는 본문 시작 쪽 기준의 근사값 (파서는 쪽 번호를 쓰지 않는다)
+    line(spec["name"])
+    blank()
+    line("목    차")
+    for i, art in enumerate(spec["articles"]):
+        label = f"{art['article_number']}({art['article_title']})"
+        dots = "." * max(3, LINE_CHARS - len(label) - 4)
+        line(f"{label} {dots} {i // 5 + 2}")
+    new_page()
+
+    truth = []
+    chapter = -1
+    for art in spec["articles"]:
+        if art["chapter"] != chapter:
+            chapter = art["chapter"]
+            blank()
+            line(f"제{chapter + 1}장 {CHAPTERS[chapter % len(CHAPTERS)]}")
+            blank()
+        if state["y"] < MARGIN_BOTTOM + LINE_HEIGHT:
+            new_page()
+        truth.append({
+            "article_number": art["article_number"],
+            "article_title": art["article_title"],
+            "page_number": state["page"],
+        })
+        line(f"{art['article_number']}({art['article_title']})")
+        for par in art["paragraphs"]:
+            for chunk in _wrap(par["text"]):
+                line(chunk)
+            for item in par["items"]:
+                for chunk in _wrap(item, LINE_CHARS - 2):
+                    line(chunk, indent=2 * FONT_SIZE)
+
+    promulgated = date.fromisoformat(spec["promulgated_date"])
+    enacted = date.fromisoformat(spec["enacted_date"])
+    blank()
+    line("부    칙")
+    line(f"<{promulgated.year}. {promulgated.month}. {promulgated.day}.>")
+    line(f"이 규정은 {enacted.year}년 {enacted.month}월 {enacted.day}일부터 시행한다.")
+    c.showPage()
+    c.save()
+
+    return {
+        "name": spec["name"],
+        "seed": spec["seed"],
+        "page_count": state["page"],
+        "enacted_date": spec["enacted_date"],
+        "articles": truth,
+    }
+
+
+def generate(
+    out_dir: Path, docs: int, pages: int, articles: int, seed: int = 0,
+    branch_ratio: float = 0.1,
+) -> list[Path]:
+    """out_dir 에 문서 docs 개 생성 → PDF 경로 목록 (정답은 같은 이름의 .truth.json)"""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    paths = []
+    for i in range(docs):
+        name = f"합성규정_{pages}p_{articles}a_{seed + i}"
+        spec = build_spec(articles, pages, seed=seed + i, branch_ratio=branch_ratio, name=name)
+        pdf_path = out_dir / f"{name}.pdf"
+        truth = render_pdf(spec, str(pdf_path))
+        truth_path(pdf_path).write_text(json.dumps(truth, ensure_ascii=False, indent=1), encoding="utf-8")
+        paths.append(pdf_path)
+    return paths
+
+
+def truth_path(pdf_path: Path) -> Path:
+    return pdf_path.with_suffix(".truth.json")
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="합성 규정 PDF 생성 (파서 회귀 코퍼스)")
+    ap.add_argument("out_dir", type=Path)
+    ap.add_argument("--docs", type=int, default=3, help="문서 수")
+    ap.add_argument("--pages", type=int, default=30, help="문서당 목표 쪽수 (근사)")
+    ap.add_argument("--articles", type=int, default=80, help="문서당 조문 수")
+    ap.add_argument("--branch-ratio", type=float, default=0.1, help="제X조의Y 조문 비율")
+    ap.add_argument("--seed", type=int, default=0)
+    args = ap.parse_args(argv)
+
+    for path in generate(
+        args.out_dir, args.docs, args.pages, args.articles, args.seed, args.branch_ratio,
+    ):
+        truth = json.loads(truth_path(path).read_text(encoding="utf-8"))
+        print(f"{path}  ({truth['page_count']}쪽 · {len(truth['articles'])}개 조문)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
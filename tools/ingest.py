@@ -0,0 +1,231 @@
+"""
+규정 PDF 일괄 적재 CLI (폴더 또는 zip).
+
+사용 예:
+    python -m tools.ingest ./규정집 --default-category 사규
+    python -m tools.ingest 부서규정.zip --map "감독/*=감독규정" --map "*모범*=모범규준"
+
+- 파일마다 별도 프로세스에서 파싱 (utils.parser.parse_pdf_document)
+- 파일마다 하나의 트랜잭션으로 저장 (db.ingest_document)
+- 개별 파일 실패는 건너뛰고 마지막에 요약 보고
+- 문서명(파일명)·분류가 겹치는 파일들은 서로 덮어쓰지 않도록 적재하지 않고 실패로 보고
+"""
+import argparse
+import fnmatch
+import io
+import multiprocessing
+import os
+import sys
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import db
+from utils.parser import parse_pdf_document, available_backends, backend_for_category
+from utils.search import CATEGORIES
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    # UTF-8 플래그가 없는 zip 은 파일명이 cp437 로 해석된다.
+    # 원래 바이트를 UTF-8(리눅스·macOS), cp949(윈도우 탐색기) 순으로 다시 해석
+    if info.flag_bits & 0x800:
+        return info.filename
+    try:
+        raw = info.filename.encode("cp437")
+    except UnicodeEncodeError:
+        return info.filename
+    for encoding in ("utf-8", "cp949"):
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+    return info.filename
+
+
+def iter_sources(path: Path) -> Iterator[tuple[str, Callable[[], bytes]]]:
+    """(상대 경로, 바이트 로더) — 파일 내용은 작업 제출 시점에만 읽는다"""
+    if path.is_dir():
+        for file in sorted(path.rglob("*")):
+            if file.is_file() and file.suffix.lower() == ".pdf":
+                yield file.relative_to(path).as_posix(), file.read_bytes
+    elif zipfile.is_zipfile(path):
+        archive = zipfile.ZipFile(path)
+        for info in archive.infolist():
+            name = _zip_member_name(info)
+            if not info.is_dir() and name.lower().endswith(".pdf"):
+                yield name, (lambda info=info: archive.read(info))
+    else:
+        raise ValueError(f"폴더 또는 zip 파일이 아닙니다: {path}")
+
+
+def resolve_category(rel_path: str, mapping: list[tuple[str, str]], default: str) -> str:
+    """--map 패턴(상대 경로 기준 fnmatch) 중 처음 일치하는 분류, 없으면 기본 분류"""
+    for pattern, category in mapping:
+        if fnmatch.fnmatch(rel_path, pattern):
+            return category
+    return default
+
+
+def _parse_map(values: list[str]) -> list[tuple[str, str]]:
+    mapping = []
+    for value in values:
+        pattern, sep, category = value.rpartition("=")
+        if not sep or not pattern:
+            raise argparse.ArgumentTypeError(f"--map 형식 오류 (패턴=분류): {value}")
+        if category not in CATEGORIES:
+            raise argparse.ArgumentTypeError(f"알 수 없는 분류: {category} (가능: {', '.join(CATEGORIES)})")
+        mapping.append((pattern, category))
+    return mapping
+
+
+def _parse_worker(data: bytes, use_cache: bool, backend: str) -> dict:
+    """워커 프로세스: 파일 하나 파싱 (쪽 단위 병렬 추출은 끔 — 파일 단위로 이미 병렬)"""
+    return parse_pdf_document(io.BytesIO(data), use_cache=use_cache, workers=1, backend=backend)
+
+
+def run(
+    path: Path, mapping: list[tuple[str, str]], default_category: str,
+    workers: int, use_cache: bool = True, backend: str | None = None,
+) -> dict:
+    """
+    backend 가 None 이면 파일 분류별 기본 백엔드(utils.parser.backend_for_category) 사용.
+
+    문서명은 파일명(확장자 제외)이므로 하위 폴더가 달라도 이름·분류가 같은 파일은
+    같은 문서를 덮어쓰게 된다 — 이런 파일들은 적재하지 않고 모두 실패로 보고한다.
+    """
+    ok: list[tuple[str, dict]] = []
+    failed: list[tuple[str, str]] = []
+    sources = []
+    by_doc: dict[tuple[str, str], list[str]] = {}
+    for rel_path, load in iter_sources(path):
+        category = resolve_category(rel_path, mapping, default_category)
+        sources.append((rel_path, category, load))
+        by_doc.setdefault((Path(rel_path).stem, category), []).append(rel_path)
+    duplicates: set[str] = set()
+    for (name, category), paths in by_doc.items():
+        if len(paths) > 1:
+            duplicates.update(paths)
+            reason = f"문서명 중복 — '{name}' ({category}) 파일 {len(paths)}개: {', '.join(paths)}"
+            failed.extend((rel_path, reason) for rel_path in paths)
+    sources = iter([src for src in sources if src[0] not in duplicates])
+
+    total_pages = 0
+    started = time.perf_counter()
+
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+        pending: dict = {}
+
+        def submit_next() -> bool:
+            for rel_path, category, load in sources:
+                try:
+                    data = load()
+                except Exception as e:
+                    failed.append((rel_path, f"읽기 실패: {e}"))
+                    continue
+                future = executor.submit(
+                    _parse_worker, data, use_cache, backend or backend_for_category(category),
+                )
+                pending[future] = (rel_path, category)
+                return True
+            return False
+
+        # 동시에 메모리에 올리는 파일 수를 워커 수의 2배로 제한
+        for _ in range(workers * 2):
+            if not submit_next():
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                rel_path, category = pending.pop(future)
+                try:
+                    parsed = future.result()
+                    if not parsed["articles"]:
+                        raise ValueError(
+                            f"조문 인식 실패 (전체 {parsed['page_count']}쪽, "
+                            f"텍스트 없는 쪽 {parsed['empty_pages']}쪽)"
+                        )
+                    diff = db.ingest_document(
+                        Path(rel_path).stem,
+                        category,
+                        parsed["articles"],
+                        filename=Path(rel_path).name,
+                        enacted_date=parsed["enacted_date"],
+                        source_type="pdf",
+                    )
+                except Exception as e:
+                    failed.append((rel_path, str(e)))
+                    status = f"실패 — {e}"
+                else:
+                    ok.append((rel_path, diff))
+                    total_pages += parsed["page_count"]
+                    status = (
+                        f"{len(parsed['articles'])}개 조문 · {parsed['page_count']}쪽"
+                        f" (신규 {diff['inserted']} · 변경 {diff['updated']} · 삭제 {diff['deleted']})"
+                    )
+
+                elapsed = time.perf_counter() - started
+                n_done = len(ok) + len(failed)
+                print(
+                    f"[{n_done}] {rel_path}: {status}"
+                    f"  | {n_done / elapsed:.2f} 파일/s · {total_pages / elapsed:.1f} 쪽/s",
+                    flush=True,
+                )
+                submit_next()
+
+    return {
+        "ok": ok,
+        "failed": failed,
+        "pages": total_pages,
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="규정 PDF 일괄 적재 (폴더 또는 zip)")
+    ap.add_argument("path", type=Path, help="PDF 폴더 또는 zip 파일")
+    ap.add_argument(
+        "--map", action="append", default=[], metavar="패턴=분류",
+        help="상대 경로 패턴별 분류 (여러 번 지정 가능, 처음 일치한 것 적용)",
+    )
+    ap.add_argument("--default-category", default="사규", choices=CATEGORIES)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="파싱 프로세스 수")
+    ap.add_argument("--no-cache", action="store_true", help="파싱 캐시 사용 안 함")
+    ap.add_argument(
+        "--backend", choices=available_backends(), default=None,
+        help="텍스트 추출 백엔드 (기본: 분류별 설정)",
+    )
+    args = ap.parse_args(argv)
+
+    try:
+        mapping = _parse_map(args.map)
+    except argparse.ArgumentTypeError as e:
+        ap.error(str(e))
+
+    db.init_db()
+    result = run(
+        args.path, mapping, args.default_category, max(1, args.workers),
+        use_cache=not args.no_cache, backend=args.backend,
+    )
+
+    elapsed = result["elapsed"]
+    n_files = len(result["ok"]) + len(result["failed"])
+    print()
+    print(f"완료: {len(result['ok'])}건 성공 · {len(result['failed'])}건 실패 / 총 {n_files}건")
+    print(
+        f"소요 {elapsed:.1f}s · {result['pages']}쪽"
+        f" · {n_files / elapsed if elapsed else 0:.2f} 파일/s"
+        f" · {result['pages'] / elapsed if elapsed else 0:.1f} 쪽/s"
+    )
+    for rel_path, reason in result["failed"]:
+        print(f"  ✗ {rel_path}: {reason}")
+    return 1 if result["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,341 @@
+"""
+FISIS·법제처 오픈API 로컬 대역 서버 (부하·회귀 테스트용).
+
+    python -m tools.mock_api --port 8765 --latency-ms 80 --error-rate 0.05 --rate-limit 30
+
+실행 후 출력되는 FSS_API_BASE / LAW_API_BASE 를 환경변수로 지정하면
+api.fss_api · api.law_api 가 실제 정부 서버 대신 이 서버를 호출한다.
+
+제공 엔드포인트 (응답 형식은 각 모듈이 파싱하는 형식과 같다):
+- /openapi/companySearch.json            증권사 목록 (국내 + 필터링될 외국계 일부)
+- /openapi/statisticsInfoSearch.json     SF408·SF304·SF308·SF307 (일부 회사는 SF408 없음 → SF308 대체 경로)
+- /LSO/openApi/getMOLSLaw.do · getMOLSAdmRul.do   법령 XML (query 별로 결정적 생성)
+
+--replay 폴더에 기록된 응답이 있으면 생성 대신 그대로 돌려준다.
+    <폴더>/companySearch.json
+    <폴더>/statisticsInfoSearch/<financeCd>_<listNo>.json
+    <폴더>/law/<query>.xml
+
+장애 주입: 응답 지연(--latency-ms, --jitter-ms), 오류율(--error-rate, 500/503),
+초당 요청 한도(--rate-limit, 초과 시 429 + Retry-After).
+"""
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+FSS_PREFIX = "/openapi"
+LAW_PREFIX = "/LSO/openApi"
+
+_FOREIGN_COMPANIES = ["노무라금융투자 서울지점", "골드만삭스증권 서울지점"]
+
+
+def _rng(*key) -> random.Random:
+    # 같은 요청에는 항상 같은 응답 (프로세스·실행 간 동일하도록 crc32 사용)
+    return random.Random(zlib.crc32("|".join(map(str, key)).encode()))
+
+
+class _RateLimiter:
+    """초당 rate 건 토큰 버킷 (순간 최대 rate 건)"""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._tokens = rate
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+class MockApiServer:
+    """
+    백그라운드 스레드에서 도는 로컬 대역 서버.
+
+        with MockApiServer(latency_ms=50).start() as server:
+            fss_api.FSS_API_BASE = server.fss_base
+            ...
+            print(server.stats())
+    """
+
+    def __init__(
+        self, host: str = "127.0.0.1", port: int = 0,
+        latency_ms: float = 0, jitter_ms: float = 0, error_rate: float = 0.0,
+        rate_limit: float = 0.0, companies: int = 40, law_articles: int = 300,
+        law_version: int = 1, replay_dir: Path | None = None, seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.companies = companies
+        self.law_articles = law_articles
+        self.law_version = law_version
+        self.replay_dir = replay_dir
+        self.seed = seed
+        self._limiter = _RateLimiter(rate_limit) if rate_limit > 0 else None
+        self._fault_rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._counts: dict[str, int] = {}
+        self._statuses: dict[int, int] = {}
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    # ── 수명 ──
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def fss_base(self) -> str:
+        return self.base_url + FSS_PREFIX
+
+    @property
+    def law_base(self) -> str:
+        return self.base_url + LAW_PREFIX
+
+    def start(self) -> "MockApiServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "requests": sum(self._counts.values()),
+                "by_path": dict(self._counts),
+                "by_status": dict(self._statuses),
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._counts.clear()
+            self._statuses.clear()
+
+    def _record(self, path: str, status: int):
+        with self._lock:
+            self._counts[path] = self._counts.get(path, 0) + 1
+            self._statuses[status] = self._statuses.get(status, 0) + 1
+
+    # ── 응답 생성 ──
+
+    def _replay(self, *parts: str) -> bytes | None:
+        if self.replay_dir is None:
+            return None
+        path = self.replay_dir.joinpath(*parts)
+        return path.read_bytes() if path.is_file() else None
+
+    def company_list(self) -> bytes:
+        recorded = self._replay("companySearch.json")
+        if recorded is not None:
+            return recorded
+        companies = [
+            {
+                "finance_cd": f"{i + 1:07d}",
+                "finance_nm": f"모의{i + 1:02d}증권(주)",
+                "finance_path": "금융투자업자>증권사>국내증권사",
+            }
+            for i in range(self.companies)
+        ]
+        companies += [
+            {
+                "finance_cd": f"{9000000 + i:07d}",
+                "finance_nm": name,
+                "finance_path": "금융투자업자>증권사>외국증권사지점",
+            }
+            for i, name in enumerate(_FOREIGN_COMPANIES)
+        ]
+        return _fisis_json(companies)
+
+    def statistics(self, finance_cd: str, list_no: str, base_mm: str) -> bytes:
+        recorded = self._replay("statisticsInfoSearch", f"{finance_cd}_{list_no}.json")
+        if recorded is not None:
+            return recorded
+        rng = _rng(self.seed, finance_cd, list_no, base_mm)
+        index = int(finance_cd) if finance_cd.isdigit() else 0
+        eok = 100_000_000
+
+        def row(account_cd: str, value: float) -> dict:
+            return {"account_cd": account_cd, "base_month": base_mm, "a": f"{value:.1f}"}
+
+        if list_no in ("SF408", "SF308"):
+            # 다섯 곳 중 한 곳은 연결 NCR(SF408) 미제출 → SF308 대체 경로
+            if list_no == "SF408" and index % 5 == 0:
+                return _fisis_json([])
+            total_risk = rng.uniform(500, 5000) * eok
+            operating = total_risk * rng.uniform(1.5, 6)
+            required = total_risk * 0.08
+            rows = [
+                row("A", operating), row("B", total_risk), row("D", required),
+                row("E", (operating - total_risk) / required * 100),
+                row("A1", rng.uniform(3000, 60000) * eok),
+            ]
+        elif list_no == "SF304":
+            rows = [row("K", rng.uniform(10000, 90000) * eok), row("L", rng.uniform(3000, 60000) * eok)]
+        elif list_no == "SF307":
+            rows = [row("I", rng.uniform(100, 900) * eok), row("J", rng.uniform(-200, 800) * eok)]
+        else:
+            return json.dumps(
+                {"result": {"err_cd": "100", "err_msg": "잘못된 리스트 번호", "list": []}},
+                ensure_ascii=False,
+            ).encode()
+        return _fisis_json(rows)
+
+    def law_xml(self, query: str) -> bytes:
+        recorded = self._replay("law", f"{query}.xml")
+        if recorded is not None:
+            return recorded
+        rng = _rng(self.seed, query)
+        promulgated = f"20{rng.randint(15, 23)}{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}"
+        effective = f"{int(promulgated[:4]) + 1}{promulgated[4:6]}{self.law_version:02d}"
+        parts = [
+            "<?xml version=\"1.0\" encoding=\"UTF-8\"?><법령>",
+            f"<기본정보><법령명_한글>{escape(query)}</법령명_한글>"
+            f"<공포일>{promulgated}</공포일><시행일>{effective}</시행일></기본정보>",
+        ]
+        for n in range(1, self.law_articles + 1):
+            paragraphs = [
+                f"{'①②③④⑤'[k]} {escape(query)}에 따른 금융투자업자는 제{n}조의 사항을 "
+                f"{rng.choice(['준수하여야 한다', '보고하여야 한다', '공시하여야 한다'])}."
+                for k in range(rng.randint(1, 5))
+            ]
+            if n == 1 and self.law_version > 1:
+                paragraphs.append(f"(개정 {self.law_version}차)")
+            parts.append(
+                f"<조문><조문번호>{n}</조문번호><조문제목>조문{n}</조문제목>"
+                f"<조문내용>제{n}조(조문{n})\n" + "\n".join(paragraphs) + "</조문내용></조문>"
+            )
+        parts.append("</법령>")
+        return "".join(parts).encode()
+
+    # ── 요청 처리 ──
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {k: v[0] for k, v in parse_qs(url.query).items()}
+                status, body, content_type, headers = server._respond(url.path, query)
+                server._record(url.path, status)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def _respond(self, path: str, query: dict) -> tuple[int, bytes, str, dict]:
+        if self._limiter is not None and not self._limiter.allow():
+            return 429, b"Too Many Requests", "text/plain", {"Retry-After": "1"}
+
+        if self.latency_ms or self.jitter_ms:
+            delay = self.latency_ms + self._fault_rng.uniform(-self.jitter_ms, self.jitter_ms)
+            time.sleep(max(0.0, delay) / 1000)
+
+        with self._lock:
+            fail = self._fault_rng.random() < self.error_rate
+            fail_status = self._fault_rng.choice((500, 503))
+        if fail:
+            return fail_status, b"Internal Server Error", "text/plain", {}
+
+        json_type = "application/json; charset=utf-8"
+        if path == f"{FSS_PREFIX}/companySearch.json":
+            return 200, self.company_list(), json_type, {}
+        if path == f"{FSS_PREFIX}/statisticsInfoSearch.json":
+            body = self.statistics(
+                query.get("financeCd", ""), query.get("listNo", ""), query.get("endBaseMm", ""),
+            )
+            return 200, body, json_type, {}
+        if path in (f"{LAW_PREFIX}/getMOLSLaw.do", f"{LAW_PREFIX}/getMOLSAdmRul.do"):
+            return 200, self.law_xml(query.get("query", "")), "application/xml; charset=utf-8", {}
+        return 404, b"Not Found", "text/plain", {}
+
+
+def _fisis_json(rows: list[dict]) -> bytes:
+    return json.dumps(
+        {"result": {"err_cd": "000", "err_msg": "정상", "list": rows}}, ensure_ascii=False,
+    ).encode()
+
+
+def add_fault_arguments(ap: argparse.ArgumentParser):
+    """MockApiServer 설정 인자 (tools.bench_api 와 공용)"""
+    ap.add_argument("--latency-ms", type=float, default=0, help="응답 지연 평균 (ms)")
+    ap.add_argument("--jitter-ms", type=float, default=0, help="응답 지연 ± 편차 (ms)")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="500/503 응답 비율 (0~1)")
+    ap.add_argument("--rate-limit", type=float, default=0.0, help="초당 요청 한도 (0 = 무제한)")
+    ap.add_argument("--companies", type=int, default=40, help="국내 증권사 수")
+    ap.add_argument("--law-articles", type=int, default=300, help="법령당 조문 수")
+    ap.add_argument("--law-version", type=int, default=1, help="법령 개정 차수 (바꾸면 응답·시행일이 달라짐)")
+    ap.add_argument("--replay", type=Path, default=None, help="기록된 응답 폴더")
+    ap.add_argument("--seed", type=int, default=0)
+
+
+def server_from_args(args: argparse.Namespace, port: int = 0) -> MockApiServer:
+    return MockApiServer(
+        port=port, latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate, rate_limit=args.rate_limit, companies=args.companies,
+        law_articles=args.law_articles, law_version=args.law_version,
+        replay_dir=args.replay, seed=args.seed,
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="FISIS·법제처 API 로컬 대역 서버")
+    ap.add_argument("--port", type=int, default=8765)
+    add_fault_arguments(ap)
+    args = ap.parse_args(argv)
+
+    server = server_from_args(args, port=args.port).start()
+    print(f"FSS_API_BASE={server.fss_base}")
+    print(f"LAW_API_BASE={server.law_base}")
+    print("Ctrl+C 로 종료", flush=True)
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stats = server.stats()
+        server.stop()
+        print(f"\n총 {stats['requests']}건 · 상태별 {stats['by_status']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,81 +2,298 @@
 PDF에서 텍스트를 추출하고 조문 단위로 파싱하는 모듈.
 조문 패턴: 제X조, 제X조의X
 """
+import hashlib
+import io
+import json
+import multiprocessing
+import os
 import re
-from typing import IO
+import sqlite3
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterable, Iterator
 
 import pdfplumber
 
+from config import (
+    PDF_EXTRACT_WORKERS, PARSE_CACHE_MAX_BYTES, PDF_BACKEND, PDF_BACKEND_BY_CATEGORY, PDF_LOW_MEMORY,
+)
+from db import get_parse_cache, put_parse_cache
+
+# 파싱 규칙(패턴·조립 방식)을 바꾸면 올린다 — 이전 버전의 파싱 캐시가 무효화된다
+PARSER_VERSION = 1
+
 ARTICLE_PATTERN = re.compile(r"^(제\s*\d+조(?:의\s*\d+)?)")
 TITLE_PATTERN   = re.compile(r"제\s*\d+조(?:의\s*\d+)?\s*[（(]([^）)\n]+)[）)]")
 TOC_PATTERN     = re.compile(r"[.·‥…]{3,}|\.{2,}\s*\d+\s*$")
 PARAGRAPH_START = re.compile(r"^[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮]|^\d+\.\s|^[가나다라마바사아자차카타파하]\.\s")
 
 
-def extract_text_by_page(pdf_file: IO[bytes]) -> list[tuple[int, str]]:
-    pages = []
+# ── 텍스트 추출 백엔드 ──────────────────────────────────────────────────────
+# 백엔드 = (쪽수 함수, 쪽 범위 추출 함수). 둘 다 PDF 바이트를 받는다.
+# 범위 추출 함수는 first..last 쪽(1부터, 양끝 포함)의 [(쪽번호, 텍스트), ...] 를 반환한다.
+# pdfplumber 외의 백엔드는 해당 패키지가 설치된 경우에만 사용할 수 있다.
+# 병렬 추출 워커는 spawn 으로 뜨므로, 백엔드는 이 모듈 import 시점에 등록되어야 한다.
+
+DEFAULT_BACKEND = "pdfplumber"
+
+_BACKENDS: dict[str, tuple] = {}
+
+
+def register_backend(name: str, page_count, extract_range, iter_pages=None):
+    """
+    iter_pages(data) 는 저메모리 모드용 쪽 단위 제너레이터 (선택).
+    없으면 extract_range 를 한 쪽씩 호출한다.
+    """
+    _BACKENDS[name] = (page_count, extract_range, iter_pages)
+
+
+def _plumber_page_count(data: bytes) -> int:
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        return len(pdf.pages)
+
+
+def _plumber_extract(data: bytes, first: int, last: int) -> list[tuple[int, str]]:
+    with pdfplumber.open(io.BytesIO(data), pages=list(range(first, last + 1))) as pdf:
+        return [(page.page_number, page.extract_text() or "") for page in pdf.pages]
+
+
+def _plumber_iter_pages(data: bytes) -> Iterator[tuple[int, str]]:
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            text = page.extract_text() or ""
+            # 글자·도형 객체와 텍스트맵 캐시를 바로 해제 — 쪽수와 무관하게 메모리 일정
+            page.close()
+            yield page.page_number, text
+
+
+def _pypdf_page_count(data: bytes) -> int:
+    from pypdf import PdfReader
+    return len(PdfReader(io.BytesIO(data)).pages)
+
+
+def _pypdf_extract(data: bytes, first: int, last: int) -> list[tuple[int, str]]:
+    from pypdf import PdfReader
+    reader = PdfReader(io.BytesIO(data))
+    return [
+        (i, reader.pages[i - 1].extract_text() or "")
+        for i in range(first, last + 1)
+    ]
+
+
+def _pymupdf_iter_pages(data: bytes) -> Iterator[tuple[int, str]]:
+    import pymupdf
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        for i in range(doc.page_count):
+            yield i + 1, doc[i].get_text() or ""
+
+
+def _pymupdf_page_count(data: bytes) -> int:
+    import pymupdf
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return doc.page_count
+
+
+def _pymupdf_extract(data: bytes, first: int, last: int) -> list[tuple[int, str]]:
+    import pymupdf
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        return [(i, doc[i - 1].get_text() or "") for i in range(first, last + 1)]
+
+
+register_backend("pdfplumber", _plumber_page_count, _plumber_extract, _plumber_iter_pages)
+register_backend("pypdf", _pypdf_page_count, _pypdf_extract)
+register_backend("pymupdf", _pymupdf_page_count, _pymupdf_extract, _pymupdf_iter_pages)
+
+_BACKEND_MODULES = {"pdfplumber": "pdfplumber", "pypdf": "pypdf", "pymupdf": "pymupdf"}
+
+
+def available_backends() -> list[str]:
+    """설치된 패키지 기준으로 사용 가능한 백엔드 목록 (기본 백엔드가 맨 앞)"""
+    names = []
+    for name in _BACKENDS:
+        module = _BACKEND_MODULES.get(name)
+        if module:
+            try:
+                __import__(module)
+            except ImportError:
+                continue
+        names.append(name)
+    return sorted(names, key=lambda n: n != DEFAULT_BACKEND)
+
+
+def backend_for_category(category: str | None) -> str:
+    """분류별 기본 백엔드 (config.PDF_BACKEND_BY_CATEGORY, 없으면 config.PDF_BACKEND)"""
+    return PDF_BACKEND_BY_CATEGORY.get(category or "", PDF_BACKEND) or DEFAULT_BACKEND
+
+
+def _get_backend(name: str) -> tuple:
+    if name not in _BACKENDS:
+        raise ValueError(f"알 수 없는 추출 백엔드: {name} (가능: {', '.join(_BACKENDS)})")
+    return _BACKENDS[name]
+
+
+# 이 쪽수 미만이면 프로세스 기동 비용이 더 크므로 단일 프로세스로 추출
+PARALLEL_MIN_PAGES = 40
+# 작업 단위(연속 쪽 범위)의 최소 크기
+_MIN_PAGES_PER_CHUNK = 10
+
+
+def extract_text_by_page(
+    pdf_file: IO[bytes], workers: int | None = None, backend: str | None = None,
+) -> list[tuple[int, str]]:
+    """
+    쪽별 텍스트 추출 → [(쪽번호, 텍스트), ...] (쪽 순서 유지)
+
+    Args:
+        workers: 병렬 프로세스 수. None 이면 config.PDF_EXTRACT_WORKERS (0 = CPU 코어 수).
+                 쪽수가 PARALLEL_MIN_PAGES 미만이거나 1 이면 단일 프로세스로 추출한다.
+        backend: 추출 백엔드 이름 (None 이면 config.PDF_BACKEND)
+    """
+    backend = backend or PDF_BACKEND or DEFAULT_BACKEND
+    page_count_fn, extract_fn, _ = _get_backend(backend)
+    try:
+        data = _read_pdf_bytes(pdf_file)
+        page_count = page_count_fn(data)
+        n_workers = _resolve_workers(workers, page_count)
+        if n_workers <= 1:
+            return extract_fn(data, 1, page_count) if page_count else []
+        return _extract_parallel(backend, data, page_count, n_workers)
+    except ImportError as e:
+        raise ValueError(f"추출 백엔드 '{backend}' 를 사용할 수 없습니다: {e}") from e
+    except Exception as e:
+        raise ValueError(f"PDF 텍스트 추출 실패: {e}") from e
+
+
+def iter_text_by_page(pdf_file: IO[bytes], backend: str | None = None) -> Iterator[tuple[int, str]]:
+    """
+    저메모리 모드: 쪽 텍스트를 하나씩 생성하고 쪽별 레이아웃 객체는 즉시 해제.
+
+    쪽 목록을 만들지 않으므로 iter_articles 와 연결하면 최대 메모리가
+    쪽수와 무관하게 거의 일정하다 (단일 프로세스로 동작).
+    """
+    backend = backend or PDF_BACKEND or DEFAULT_BACKEND
+    page_count_fn, extract_fn, iter_fn = _get_backend(backend)
     try:
-        with pdfplumber.open(pdf_file) as pdf:
-            for i, page in enumerate(pdf.pages, start=1):
-                text = page.extract_text() or ""
-                pages.append((i, text))
+        data = _read_pdf_bytes(pdf_file)
+        if iter_fn is not None:
+            yield from iter_fn(data)
+        else:
+            for i in range(1, page_count_fn(data) + 1):
+                yield from extract_fn(data, i, i)
+    except ImportError as e:
+        raise ValueError(f"추출 백엔드 '{backend}' 를 사용할 수 없습니다: {e}") from e
     except Exception as e:
         raise ValueError(f"PDF 텍스트 추출 실패: {e}") from e
-    return pages
+
+
+def _read_pdf_bytes(pdf_file: IO[bytes]) -> bytes:
+    if hasattr(pdf_file, "seek"):
+        pdf_file.seek(0)
+    return pdf_file.read()
+
+
+def _resolve_workers(workers: int | None, page_count: int) -> int:
+    if page_count < PARALLEL_MIN_PAGES:
+        return 1
+    n = workers if workers is not None else PDF_EXTRACT_WORKERS
+    if n <= 0:
+        n = os.cpu_count() or 1
+    return max(1, min(n, page_count // _MIN_PAGES_PER_CHUNK))
+
+
+def _page_ranges(page_count: int, n_workers: int) -> list[tuple[int, int]]:
+    """1..page_count 를 연속 범위로 분할 (워커당 2개 — 쪽마다 추출 시간이 달라도 고르게 분산)"""
+    n_chunks = min(n_workers * 2, max(1, page_count // _MIN_PAGES_PER_CHUNK))
+    size = -(-page_count // n_chunks)
+    return [
+        (start, min(start + size - 1, page_count))
+        for start in range(1, page_count + 1, size)
+    ]
+
+
+def _extract_range(backend: str, data: bytes, first: int, last: int) -> list[tuple[int, str]]:
+    """워커 프로세스: first..last 쪽 텍스트 추출"""
+    return _get_backend(backend)[1](data, first, last)
+
+
+def _extract_parallel(backend: str, data: bytes, page_count: int, n_workers: int) -> list[tuple[int, str]]:
+    ranges = _page_ranges(page_count, n_workers)
+    # Streamlit 스크립트 스레드에서 fork 하지 않도록 spawn 컨텍스트 사용
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=ctx) as executor:
+        chunks = executor.map(
+            _extract_range, [backend] * len(ranges), [data] * len(ranges), *zip(*ranges),
+        )
+        return [page for chunk in chunks for page in chunk]
 
 
 def _normalize_article_number(raw: str) -> str:
     return re.sub(r"\s+", "", raw)
 
 
-def parse_articles(pages: list[tuple[int, str]]) -> list[dict]:
-    all_lines: list[tuple[int, str]] = []
+def parse_articles(pages: Iterable[tuple[int, str]]) -> list[dict]:
+    return list(iter_articles(pages))
+
+
+def iter_articles(pages: Iterable[tuple[int, str]]) -> Iterator[dict]:
+    """
+    쪽 텍스트를 순서대로 소비하며 조문을 하나씩 생성.
+
+    다음 '제X조' 머리가 나오는 즉시 직전 조문을 내보내므로 메모리에는
+    조립 중인 조문 1건만 남는다. 본문은 조각 리스트에 모았다가 한 번만
+    join 하므로 조문 길이에 선형이다. pages 는 제너레이터여도 된다.
+    """
+    current: dict | None = None
+    parts: list[str] = []
+
+    def finish() -> dict | None:
+        current["article_text"] = "".join(parts).strip()
+        return None if _is_toc_entry(current) else current
+
     for page_num, text in pages:
         for line in text.splitlines():
-            all_lines.append((page_num, line))
+            stripped = line.strip()
+            if not stripped:
+                if current:
+                    parts.append("\n")
+                continue
 
-    articles: list[dict] = []
-    current: dict | None = None
+            m = ARTICLE_PATTERN.match(stripped)
+            if m:
+                if current:
+                    article = finish()
+                    if article:
+                        yield article
 
-    for page_num, line in all_lines:
-        stripped = line.strip()
-        if not stripped:
-            if current:
-                current["article_text"] += "\n"
-            continue
-
-        m = ARTICLE_PATTERN.match(stripped)
-        if m:
-            if current:
-                current["article_text"] = current["article_text"].strip()
-                articles.append(current)
-
-            raw_number = m.group(1)
-            article_number = _normalize_article_number(raw_number)
-            title_m = TITLE_PATTERN.search(stripped)
-            article_title = title_m.group(1).strip() if title_m else None
-
-            current = {
-                "article_number": article_number,
-                "article_title": article_title,
-                "article_text": stripped + "\n",
-                "page_number": page_num,
-            }
-        else:
-            if current:
+                raw_number = m.group(1)
+                title_m = TITLE_PATTERN.search(stripped)
+                current = {
+                    "article_number": _normalize_article_number(raw_number),
+                    "article_title": title_m.group(1).strip() if title_m else None,
+                    "article_text": "",
+                    "page_number": page_num,
+                }
+                parts = [stripped, "\n"]
+            elif current:
                 if PARAGRAPH_START.match(stripped):
-                    current["article_text"] += "\n" + stripped
-                else:
-                    if current["article_text"].endswith("-"):
-                        current["article_text"] = current["article_text"][:-1] + stripped
+                    parts.append("\n")
+                    parts.append(stripped)
+                elif parts[-1].endswith("-"):
+                    # 하이픈으로 끊긴 줄은 공백 없이 잇는다
+                    head = parts[-1][:-1]
+                    if head:
+                        parts[-1] = head
                     else:
-                        current["article_text"] += " " + stripped
+                        parts.pop()
+                    parts.append(stripped)
+                else:
+                    parts.append(" ")
+                    parts.append(stripped)
 
     if current:
-        current["article_text"] = current["article_text"].strip()
-        articles.append(current)
-
-    return [a for a in articles if not _is_toc_entry(a)]
+        article = finish()
+        if article:
+            yield article
 
 
 def _is_toc_entry(article: dict) -> bool:
@@ -95,6 +312,74 @@ def parse_pdf(pdf_file: IO[bytes]) -> list[dict]:
     return parse_articles(pages)
 
 
+def parse_pdf_document(
+    pdf_file: IO[bytes], use_cache: bool = True, workers: int | None = None,
+    backend: str | None = None, low_memory: bool | None = None,
+) -> dict:
+    """
+    PDF 한 번 추출로 조문·시행일·쪽 통계를 함께 산출.
+
+    같은 내용의 PDF(파일명·문서명 무관)는 SHA-256 + PARSER_VERSION 키의
+    파싱 캐시에서 바로 반환하여 pdfplumber 를 거치지 않는다.
+    workers·backend 는 extract_text_by_page 로 그대로 전달되며,
+    백엔드마다 추출 결과가 다를 수 있어 캐시 키에 백엔드 이름도 포함한다.
+    low_memory (None 이면 config.PDF_LOW_MEMORY) 이면 iter_text_by_page 로
+    쪽을 흘려보내며 파싱하고, 쪽 통계는 누적값만, 시행일 탐색용으로는 부칙 이후 텍스트만 남긴다.
+
+    Returns:
+        {
+            "articles":     parse_articles 결과,
+            "enacted_date": "YYYY-MM-DD" 또는 None,
+            "page_count":   전체 쪽수,
+            "empty_pages":  텍스트가 없는 쪽수 (스캔 이미지 등),
+            "char_count":   추출된 전체 글자 수,
+        }
+    """
+    backend = backend or PDF_BACKEND or DEFAULT_BACKEND
+    data = _read_pdf_bytes(pdf_file)
+    content_key = f"{hashlib.sha256(data).hexdigest()}:{backend}"
+    if use_cache:
+        payload = get_parse_cache(content_key, PARSER_VERSION)
+        if payload is not None:
+            return json.loads(zlib.decompress(payload))
+
+    if low_memory is None:
+        low_memory = PDF_LOW_MEMORY
+    if low_memory:
+        # 쪽 텍스트는 조문 조립·통계·시행일 탐색에 흘려보내고 보관하지 않는다
+        stats = {"page_count": 0, "empty_pages": 0, "char_count": 0}
+        scanner = _EnactedDateScanner()
+
+        def stream() -> Iterator[tuple[int, str]]:
+            for page in iter_text_by_page(io.BytesIO(data), backend=backend):
+                text = page[1]
+                stats["page_count"] += 1
+                stats["empty_pages"] += not text.strip()
+                stats["char_count"] += len(text)
+                scanner.feed(text)
+                yield page
+
+        parsed = {"articles": parse_articles(stream()), "enacted_date": scanner.result(), **stats}
+    else:
+        pages = extract_text_by_page(io.BytesIO(data), workers=workers, backend=backend)
+        parsed = {
+            "articles":     parse_articles(pages),
+            "enacted_date": find_enacted_date(pages),
+            "page_count":   len(pages),
+            "empty_pages":  sum(1 for _, text in pages if not text.strip()),
+            "char_count":   sum(len(text) for _, text in pages),
+        }
+    if use_cache:
+        payload = zlib.compress(
+            json.dumps(parsed, ensure_ascii=False, separators=(",", ":")).encode(), 6,
+        )
+        try:
+            put_parse_cache(content_key, PARSER_VERSION, payload, PARSE_CACHE_MAX_BYTES)
+        except sqlite3.OperationalError:
+            pass  # 캐시 저장은 부가 기능 — DB 가 잠겨 있으면 이번 결과만 저장하지 않는다
+    return parsed
+
+
 _ENACTED_PATTERNS = [
     re.compile(r"(\d{4})\s*년\s*(\d{1,2})\s*월\s*(\d{1,2})\s*일\s*(?:부터\s*)?시행"),
     re.compile(r"시행일?\s*[：:\s]\s*(\d{4})[.\s]\s*(\d{1,2})[.\s]\s*(\d{1,2})"),
@@ -102,20 +387,57 @@ _ENACTED_PATTERNS = [
 ]
 
 
-def extract_enacted_date(pdf_file: IO[bytes]) -> str | None:
-    pdf_file.seek(0)
-    pages = extract_text_by_page(pdf_file)
-    full_text = "\n".join(text for _, text in pages)
+_ADDENDUM_PATTERN = re.compile(r"부\s*칙")
+
+
+class _EnactedDateScanner:
+    """
+    쪽 텍스트를 차례로 받으며 시행일을 찾는다 (부칙 이후 우선).
+
+    전체 텍스트를 모으지 않고 첫 '부칙' 이후 텍스트와 패턴별 첫 일치만 보관하므로
+    저메모리 파싱에서도 쪽수와 무관하게 메모리가 일정하다 (부칙 분량만큼만 늘어남).
+    쪽 경계에 걸친 일치를 놓치지 않도록 직전 쪽 끝 _OVERLAP 자를 이어 붙여 검사한다.
+    """
+    _OVERLAP = 200
+
+    def __init__(self):
+        self._tail = ""
+        self._first: list[tuple[str, str, str] | None] = [None] * len(_ENACTED_PATTERNS)
+        self._addendum: list[str] | None = None
+
+    def feed(self, text: str):
+        window = f"{self._tail}\n{text}" if self._tail else text
+        for i, pattern in enumerate(_ENACTED_PATTERNS):
+            if self._first[i] is None:
+                m = pattern.search(window)
+                if m:
+                    self._first[i] = m.group(1, 2, 3)
+        if self._addendum is not None:
+            self._addendum.append(text)
+        else:
+            m = _ADDENDUM_PATTERN.search(window)
+            if m:
+                self._addendum = [window[m.start():]]
+        self._tail = window[-self._OVERLAP:]
+
+    def result(self) -> str | None:
+        search_text = "\n".join(self._addendum) if self._addendum is not None else None
+        for pattern, first in zip(_ENACTED_PATTERNS, self._first):
+            m = pattern.search(search_text) if search_text is not None else None
+            groups = m.group(1, 2, 3) if m else first
+            if groups:
+                year, month, day = groups
+                return f"{year}-{int(month):02d}-{int(day):02d}"
+        return None
 
-    addendum_match = re.search(r"부\s*칙", full_text)
-    search_text = full_text[addendum_match.start():] if addendum_match else full_text
 
-    for pattern in _ENACTED_PATTERNS:
-        m = pattern.search(search_text)
-        if not m:
-            m = pattern.search(full_text)
-        if m:
-            year, month, day = m.group(1), m.group(2), m.group(3)
-            return f"{year}-{int(month):02d}-{int(day):02d}"
+def find_enacted_date(pages: Iterable[tuple[int, str]]) -> str | None:
+    """추출된 쪽 텍스트에서 시행일 탐색 (부칙 이후 우선)"""
+    scanner = _EnactedDateScanner()
+    for _, text in pages:
+        scanner.feed(text)
+    return scanner.result()
 
-    return None
+
+def extract_enacted_date(pdf_file: IO[bytes]) -> str | None:
+    return find_enacted_date(extract_text_by_page(pdf_file))
@@ -3,8 +3,14 @@
 """
 import re
 import html
+import functools
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Iterable
 
-from db import search_articles
+from db import search_articles_page, get_corpus_version
+from utils.text import normalize_article_text
 
 CATEGORIES = ["법령", "모범규준", "사규", "감독규정"]
 
@@ -16,62 +22,222 @@ CATEGORY_COLORS = {
 }
 
 
-def run_search(keyword: str, selected_categories: list[str]) -> list[dict]:
+# ── 검색 결과 캐시 ──────────────────────────────────────────────────────────
+# 프로세스 전역 LRU — run_search_page 의 페이지 단위 결과(스니펫 행 10건 안팎)를 담는다.
+# 키에 코퍼스 버전(db.get_corpus_version)이 포함되므로
+# 문서 적재·삭제 직후에는 이전 버전의 결과가 절대 반환되지 않는다.
+# 캐시된 결과는 세션 간에 공유되므로 호출 측에서 수정하지 않는다.
+# 항목당 수 KB 이므로 보통은 항목 수 한도가 먼저 걸리고, 바이트 한도는 안전장치다.
+
+_CACHE_MAX_ENTRIES = 256
+_CACHE_MAX_BYTES   = 8 * 1024 * 1024
+
+
+def _estimate_size(value: dict) -> int:
+    """결과 크기 근사치 (문자열 길이 합 + 행당 고정 오버헤드)"""
+    size = 0
+    for row in value["rows"]:
+        size += 200
+        for v in row.values():
+            if isinstance(v, str):
+                size += len(v)
+    return size
+
+
+class SearchCache:
+    """크기 제한 LRU 캐시 (항목 수·근사 바이트 수 모두 제한)"""
+
+    def __init__(self, max_entries: int = _CACHE_MAX_ENTRIES, max_bytes: int = _CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._data: OrderedDict = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value):
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._data[key] = (value, size)
+            self._bytes += size
+            while len(self._data) > self.max_entries or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= evicted
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._data),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_search_cache = SearchCache()
+
+
+def normalize_query(keyword: str) -> str:
+    """캐시 키·DB 검색에 공통으로 쓰는 검색어 (NFC 정규화 + 앞뒤 공백 제거)"""
+    return unicodedata.normalize("NFC", keyword).strip()
+
+
+def search_cache_stats() -> dict:
+    return _search_cache.stats()
+
+
+def run_search_page(
+    keyword: str, selected_categories: list[str],
+    after: list | None = None, per_page: int = 10,
+) -> dict:
+    """한 페이지 분량의 검색 결과 (total/facets/rows/next_cursor)"""
     cats = selected_categories if selected_categories else None
-    return search_articles(keyword, cats)
+    query = normalize_query(keyword)
+    key = (
+        query, tuple(sorted(cats or ())),
+        tuple(after) if after else None, per_page, get_corpus_version(),
+    )
+    results = _search_cache.get(key)
+    if results is None:
+        results = search_articles_page(query, cats, after=after, limit=per_page)
+        for row in results["rows"]:
+            row["snippet_md"] = snippet_markdown(row)
+        _search_cache.put(key, results)
+    return results
 
 
-_MARK_STYLE = (
-    'background:#C8A96E;color:#FFFFFF;'
-    'padding:0 2px;border-radius:2px;font-weight:600;'
-)
+_MD_SPECIAL = re.compile(r"([\\`*_\[\]<>~|$])")
 
 
-def _apply_highlight(escaped_text: str, keyword: str) -> str:
-    if not keyword or not keyword.strip():
-        return escaped_text
-    pattern = re.compile(re.escape(html.escape(keyword)), re.IGNORECASE)
-    return pattern.sub(
-        lambda m: f'<mark style="{_MARK_STYLE}">{m.group()}</mark>',
-        escaped_text,
-    )
+def _md_escape(text: str) -> str:
+    return _MD_SPECIAL.sub(r"\\\1", text)
 
 
-def highlight_snippet(text: str, keyword: str) -> str:
-    return _apply_highlight(html.escape(text), keyword)
+def snippet_markdown(row: dict) -> str:
+    """
+    결과 카드용 스니펫 (마크다운, 일치 구간 굵게).
 
+    DB가 계산한 스니펫과 일치 오프셋(match_offset/match_len)만 사용하므로
+    본문 검색이나 정규화를 다시 하지 않는다.
+    """
+    snippet = (row["snippet"] or "").replace("\n", " ")
+    head = "…" if row["snippet_start"] > 1 else ""
+    tail = "…" if row["snippet_start"] + len(snippet) - 1 < row["text_len"] else ""
+    offset, length = row["match_offset"], row["match_len"]
+    if offset >= 0 and length:
+        body = (
+            _md_escape(snippet[:offset])
+            + "**" + _md_escape(snippet[offset:offset + length]) + "**"
+            + _md_escape(snippet[offset + length:])
+        )
+    else:
+        body = _md_escape(snippet)
+    return head + body + tail
 
 
-_PARAGRAPH_START = re.compile(
-    r"^[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮]|^\d+\.\s|^[가나다라마바사아자차카타파하]\.\s"
+_MARK_STYLE = (
+    'background:#C8A96E;color:#FFFFFF;'
+    'padding:0 2px;border-radius:2px;font-weight:600;'
 )
 
 
-def normalize_article_text(text: str) -> str:
-    lines = text.splitlines()
-    result = ""
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            if result:
-                result += "\n"
+# ── 하이라이트 ──────────────────────────────────────────────────────────────
+# 여러 검색어(공백 구분 토큰, 동의어 등)를 본문 한 번 훑기로 표시한다.
+# 검색어 집합은 트라이 형태의 정규식으로 컴파일되어 위치마다 검사 비용이
+# 검색어 개수가 아니라 검색어 길이에 비례하며, 컴파일 결과는 LRU로 재사용한다.
+# 겹치거나 맞닿은 일치 구간(예: 순자본 + 자본비율)은 하나의 <mark>로 합친다.
+
+def query_terms(keyword: str, extra_terms: Iterable[str] = ()) -> list[str]:
+    """검색어 → 하이라이트 대상 목록 (검색어 전체 + 공백 구분 토큰 + 추가 용어)"""
+    terms = [keyword.strip(), *keyword.split(), *extra_terms]
+    return [t for t in terms if t.strip()]
+
+
+def _trie_pattern(node: dict) -> str:
+    alts = [
+        re.escape(ch) + _trie_pattern(child)
+        for ch, child in sorted(node.items()) if ch
+    ]
+    if not alts:
+        return ""
+    body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+    # 여기서 끝나는 용어가 있으면 뒤는 선택 — 탐욕적이므로 가장 긴 용어가 우선
+    return f"(?:{body})?" if "" in node else body
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_terms(terms: tuple[str, ...]) -> re.Pattern | None:
+    trie: dict = {}
+    for term in terms:
+        node = trie
+        for ch in term:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    pattern = _trie_pattern(trie)
+    if not pattern:
+        return None
+    # 전방탐색으로 모든 시작 위치의 최장 일치를 얻는다 (겹침 포함)
+    return re.compile(f"(?=({pattern}))", re.IGNORECASE)
+
+
+def highlight_html(text: str, terms: Iterable[str]) -> str:
+    """원문에서 용어를 찾아 HTML 이스케이프 + <mark> 처리한 문자열 반환"""
+    key = tuple(sorted({t.lower() for t in terms if t.strip()}))
+    matcher = _compile_terms(key) if key else None
+    if matcher is None:
+        return html.escape(text)
+
+    out: list[str] = []
+    pos = 0
+    span_start = span_end = -1
+    for m in matcher.finditer(text):
+        start, end = m.start(), m.end(1)
+        if end == start:
+            continue
+        if start <= span_end:
+            span_end = max(span_end, end)
             continue
-        if not result:
-            result = stripped
-        elif _PARAGRAPH_START.match(stripped):
-            result += "\n" + stripped
-        else:
-            if result.endswith("-"):
-                result = result[:-1] + stripped
-            else:
-                result += " " + stripped
-    return re.sub(r"[ \t]{2,}", " ", result)
-
-
-def highlight_full_text(text: str, keyword: str) -> str:
-    normalized = normalize_article_text(text)
-    escaped = _apply_highlight(html.escape(normalized), keyword)
-    return escaped.replace("\n", "<br>")
+        if span_end >= 0:
+            out.append(html.escape(text[pos:span_start]))
+            out.append(f'<mark style="{_MARK_STYLE}">{html.escape(text[span_start:span_end])}</mark>')
+            pos = span_end
+        span_start, span_end = start, end
+    if span_end >= 0:
+        out.append(html.escape(text[pos:span_start]))
+        out.append(f'<mark style="{_MARK_STYLE}">{html.escape(text[span_start:span_end])}</mark>')
+        pos = span_end
+    out.append(html.escape(text[pos:]))
+    return "".join(out)
+
+
+def highlight_full_text(display_text: str, keyword: str, extra_terms: Iterable[str] = ()) -> str:
+    """정규화된 본문(articles.display_text)에 하이라이트를 입혀 HTML로 반환"""
+    highlighted = highlight_html(display_text, query_terms(keyword, extra_terms))
+    return highlighted.replace("\n", "<br>")
 
 
 def category_badge(category: str) -> str:
@@ -0,0 +1,43 @@
+"""
+조문 본문 정규화 모듈 (적재 시점에 한 번 계산하여 articles.display_text 로 저장).
+"""
+import re
+
+PARAGRAPH_START = re.compile(r"^[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮]|^\d+\.\s|^[가나다라마바사아자차카타파하]\.\s")
+
+_MULTI_SPACE = re.compile(r"[ \t]{2,}")
+
+
+def normalize_article_text(text: str) -> str:
+    """
+    PDF 줄바꿈을 정리한 화면 표시용 본문.
+
+    - 항·호 시작(①, 1., 가.)은 줄을 바꾸고, 나머지 줄은 공백으로 잇는다.
+    - 하이픈으로 끝난 줄은 다음 줄과 붙인다.
+    - 빈 줄은 줄바꿈으로 유지한다.
+
+    조각을 리스트에 모아 마지막에 한 번만 join 하므로 본문 길이에 선형이다.
+    """
+    parts: list[str] = []
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            if parts:
+                parts.append("\n")
+            continue
+        if not parts:
+            parts.append(stripped)
+        elif PARAGRAPH_START.match(stripped):
+            parts.append("\n")
+            parts.append(stripped)
+        elif parts[-1].endswith("-"):
+            head = parts[-1][:-1]
+            if head:
+                parts[-1] = head
+            else:
+                parts.pop()
+            parts.append(stripped)
+        else:
+            parts.append(" ")
+            parts.append(stripped)
+    return _MULTI_SPACE.sub(" ", "".join(parts))
@@ -1,13 +1,15 @@
 import io
+import sqlite3
 
 import streamlit as st
 
 from db import (
-    upsert_document, insert_articles, update_article_count,
-    get_all_documents, delete_document,
+    ingest_document, get_all_documents, delete_document,
 )
-from utils.parser import parse_pdf, extract_enacted_date
-from api.law_api import MANAGED_LAWS, crawl_single_law
+from utils.parser import parse_pdf_document, available_backends, backend_for_category
+from api.law_api import MANAGED_LAWS, crawl_laws
+from components.job_status import render_job_status
+from core import jobs
 
 # 업로드 가능 분류: 법령·감독규정은 크롤링으로만 등록
 UPLOAD_CATEGORIES = ["모범규준", "사규"]
@@ -46,6 +48,7 @@ def render():
 
     if update_all:
         _run_crawler_update(MANAGED_LAWS)
+    render_job_status("law_crawl", "법령 업데이트")
 
     st.markdown("<div style='margin-bottom:12px;'></div>", unsafe_allow_html=True)
 
@@ -70,6 +73,11 @@ def render():
                 doc_category = st.selectbox("분류", UPLOAD_CATEGORIES)
 
             uploaded_file = st.file_uploader("PDF 파일", type=["pdf"])
+            backend_choice = st.selectbox(
+                "텍스트 추출 엔진",
+                ["분류 기본값"] + available_backends(),
+                help="텍스트 위주 PDF는 pymupdf·pypdf 가 더 빠를 수 있습니다.",
+            )
             submitted = st.form_submit_button("업로드 및 인덱싱", type="primary")
 
         if submitted:
@@ -82,27 +90,39 @@ def render():
                     try:
                         # 메모리에서만 처리 — 디스크 저장 없음
                         pdf_bytes = io.BytesIO(uploaded_file.read())
-                        articles = parse_pdf(pdf_bytes)
-                        enacted_date = extract_enacted_date(pdf_bytes)
+                        backend = (
+                            backend_for_category(doc_category)
+                            if backend_choice == "분류 기본값" else backend_choice
+                        )
+                        parsed = parse_pdf_document(pdf_bytes, backend=backend)
+                        articles = parsed["articles"]
+                        enacted_date = parsed["enacted_date"]
                     except ValueError as e:
                         st.error(f"파싱 오류: {e}")
                         st.stop()
+                    except sqlite3.OperationalError as e:
+                        st.error(f"DB 사용 중 오류 (다른 작업이 진행 중일 수 있습니다. 잠시 후 다시 시도해주세요): {e}")
+                        st.stop()
 
                 if not articles:
                     st.warning(
                         "조문을 인식하지 못했습니다. "
                         "텍스트 레이어가 없거나 '제X조' 형식의 조문이 없는 PDF일 수 있습니다."
+                        f" (전체 {parsed['page_count']}쪽 중 텍스트 없는 쪽 {parsed['empty_pages']}쪽)"
                     )
                 else:
-                    doc_id = upsert_document(
-                        doc_name.strip(), doc_category, "",
-                        enacted_date, source_type="pdf",
-                    )
-                    insert_articles(doc_id, articles)
-                    update_article_count(doc_id, len(articles))
+                    try:
+                        diff = ingest_document(
+                            doc_name.strip(), doc_category, articles,
+                            enacted_date=enacted_date, source_type="pdf",
+                        )
+                    except sqlite3.OperationalError as e:
+                        st.error(f"DB 사용 중 오류 (다른 작업이 진행 중일 수 있습니다. 잠시 후 다시 시도해주세요): {e}")
+                        st.stop()
                     st.success(
                         f'"{doc_name}" 업로드 완료 — {len(articles)}개 조문 인식'
                         f'{"  (시행일: " + enacted_date + ")" if enacted_date else ""}'
+                        f' · 신규 {diff["inserted"]} · 변경 {diff["updated"]} · 삭제 {diff["deleted"]}'
                     )
                     st.rerun()
 
@@ -245,17 +265,21 @@ def render():
 
 
 def _run_crawler_update(laws: list[dict]):
-    """법령 목록을 순서대로 크롤링하여 DB에 저장."""
-    progress = st.progress(0, text="업데이트 준비 중...")
-    results = []
-    for i, law in enumerate(laws):
-        progress.progress(i / len(laws), text=f"수신 중: {law['name']}")
-        success, msg = crawl_single_law(law)
-        results.append((success, msg))
-    progress.progress(1.0, text="완료")
-    for success, msg in results:
-        if success:
-            st.success(msg)
-        else:
-            st.error(msg)
+    """법령 크롤링을 백그라운드 작업으로 등록 (같은 대상이 진행 중이면 그 작업을 이어서 표시)."""
+    jobs.submit("law_crawl", {"laws": [law["name"] for law in laws]})
     st.rerun()
+
+
+def _crawl_job(params: dict, report) -> dict:
+    """백그라운드 작업: 법령 목록을 동시에 크롤링하여 DB에 저장 (완료되는 순서대로 진행률 보고)."""
+    names = set(params["laws"])
+    laws = [law for law in MANAGED_LAWS if law["name"] in names]
+    report(0.0, f"수신 중: {len(laws)}개 법령")
+    messages = []
+    for done, (law, success, msg) in enumerate(crawl_laws(laws), start=1):
+        messages.append(["success" if success else "error", msg])
+        report(done / len(laws), f"완료 {done}/{len(laws)}: {law['name']}")
+    return {"messages": messages}
+
+
+jobs.register("law_crawl", _crawl_job)
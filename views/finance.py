@@ -9,6 +9,8 @@ import streamlit as st
 
 import db
 from api.fss_api import collect_all_securities_data
+from components.job_status import render_job_status
+from core import jobs
 
 def _current_quarter() -> str:
     """오늘 날짜 기준 현재 분기 반환. 예: '2026Q1'"""
@@ -179,6 +181,7 @@ def _render_data_management():
     with col2:
         if st.button("수집 시작", type="primary", use_container_width=True):
             _update_fss_data(current_q, "ncr_data")
+    render_job_status("fss_update", "최신 데이터 수집")
 
     # ── 강제 재수집 ──────────────────────────────────────────────────────────
     if available:
@@ -201,6 +204,7 @@ def _render_data_management():
             one_year_ago = f"{now.year - 1}Q{(now.month - 1) // 3 + 1}"
             force_quarters = sorted(q for q in set(available) | set(missing) if q >= one_year_ago)
             _collect_historical(force_quarters)
+        render_job_status("fss_collect", "강제 재수집")
 
     # ── 수집 로그 ────────────────────────────────────────────────────────────
     st.markdown(
@@ -411,14 +415,25 @@ def _fmt_quarter(q: str) -> str:
 
 
 def _collect_historical(quarters: list[str]):
-    """미수집(또는 강제 재수집) 분기를 순서대로 수집. 오래된 것부터."""
+    """분기 이력 수집을 백그라운드 작업으로 등록."""
+    jobs.submit("fss_collect", {"quarters": quarters})
+    st.rerun()
+
+
+def _update_fss_data(quarter: str, data_source: str):
+    """최신 분기 수집을 백그라운드 작업으로 등록."""
+    jobs.submit("fss_update", {"quarter": quarter, "data_source": data_source})
+    st.rerun()
+
+
+def _collect_historical_job(params: dict, report) -> dict:
+    """백그라운드 작업: 미수집(또는 강제 재수집) 분기를 순서대로 수집. 오래된 것부터."""
+    quarters = params["quarters"]
     total = len(quarters)
-    progress = st.progress(0, text="이력 수집 준비 중...")
-    status = st.empty()
     success_cnt, fail_cnt = 0, 0
 
     for i, q in enumerate(quarters):
-        status.markdown(f"`{q}` 수집 중... ({i + 1}/{total})")
+        report(i / total, f"{q} 수집 중... ({i + 1}/{total})")
         try:
             data_list = collect_all_securities_data(q)
             if data_list:
@@ -430,45 +445,43 @@ def _collect_historical(quarters: list[str]):
         except Exception as e:
             db.log_fss_update("ncr_data", q, "failed", 0, str(e))
             fail_cnt += 1
-        progress.progress((i + 1) / total, text=f"{i + 1}/{total} 완료")
-
-    status.empty()
-    progress.empty()
+        report((i + 1) / total, f"{i + 1}/{total} 완료")
 
     latest = db.get_available_quarters("ncr_data")
     if latest:
         msg = f"✅ {_fmt_quarter(latest[0])}까지 최신 자료를 모두 수집했습니다."
         if fail_cnt:
             msg += f" (실패 {fail_cnt}개 분기)"
-        st.success(msg)
-    else:
-        st.warning("수집된 데이터가 없습니다.")
-    st.rerun()
+        return {"messages": [["success", msg]]}
+    return {"messages": [["warning", "수집된 데이터가 없습니다."]]}
 
 
-def _update_fss_data(quarter: str, data_source: str):
-    """현재 분기부터 최대 4분기 거슬러 올라가며 데이터가 있는 최신 분기를 수집."""
+def _update_fss_data_job(params: dict, report) -> dict:
+    """백그라운드 작업: 지정 분기부터 최대 4분기 거슬러 올라가며 데이터가 있는 최신 분기를 수집."""
+    quarter, data_source = params["quarter"], params["data_source"]
     all_q = _generate_quarters(2016)
     # 지정 분기 이하를 최신순으로 최대 4개 시도
     candidates = [q for q in reversed(all_q) if q <= quarter][:4]
 
     found_quarter = None
-    with st.spinner("최신 데이터 조회 중..."):
-        for q in candidates:
-            try:
-                data_list = collect_all_securities_data(q)
-                if data_list:
-                    db.save_fss_data(q, data_source, data_list)
-                    db.log_fss_update(data_source, q, "success", len(data_list))
-                    found_quarter = q
-                    break
-                else:
-                    db.log_fss_update(data_source, q, "success", 0)
-            except Exception as e:
-                db.log_fss_update(data_source, q, "failed", 0, str(e))
+    for i, q in enumerate(candidates):
+        report(i / len(candidates), f"{q} 조회 중...")
+        try:
+            data_list = collect_all_securities_data(q)
+            if data_list:
+                db.save_fss_data(q, data_source, data_list)
+                db.log_fss_update(data_source, q, "success", len(data_list))
+                found_quarter = q
+                break
+            else:
+                db.log_fss_update(data_source, q, "success", 0)
+        except Exception as e:
+            db.log_fss_update(data_source, q, "failed", 0, str(e))
 
     if found_quarter:
-        st.success(f"✅ {_fmt_quarter(found_quarter)}까지 최신 자료를 모두 수집했습니다.")
-        st.rerun()
-    else:
-        st.error("수집 가능한 데이터가 없습니다. 잠시 후 다시 시도해주세요.")
+        return {"messages": [["success", f"✅ {_fmt_quarter(found_quarter)}까지 최신 자료를 모두 수집했습니다."]]}
+    return {"messages": [["error", "수집 가능한 데이터가 없습니다. 잠시 후 다시 시도해주세요."]]}
+
+
+jobs.register("fss_collect", _collect_historical_job)
+jobs.register("fss_update", _update_fss_data_job)
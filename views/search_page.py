@@ -3,7 +3,7 @@ import urllib.parse
 
 import streamlit as st
 
-from utils.search import run_search, highlight_full_text, highlight_snippet, normalize_article_text, category_badge, CATEGORIES
+from utils.search import run_search_page, category_badge, CATEGORIES
 
 
 def render():
@@ -79,13 +79,16 @@ def render():
         st.session_state["_search_history"] = hist[:6]
 
         st.session_state["_last_keyword"] = keyword
-        st.session_state["_results"] = run_search(keyword, selected_categories)
-        st.session_state["_page"] = 0
+        st.session_state.pop("_results_qkey", None)
     elif not keyword:
         st.session_state.pop("_results", None)
         st.session_state.pop("_last_keyword", None)
+        st.session_state.pop("_results_qkey", None)
         st.session_state["_page"] = 0
 
+    if st.session_state.get("_last_keyword"):
+        _fetch_page(st.session_state["_last_keyword"], selected_categories)
+
     results = st.session_state.get("_results")
 
     if results is None:
@@ -95,7 +98,7 @@ def render():
         )
         return
 
-    if not results:
+    if not results["rows"]:
         st.markdown(
             f'<p style="color:#666;font-size:0.88rem;">'
             f'<b>"{keyword}"</b> 에 해당하는 조문을 찾을 수 없습니다.</p>',
@@ -104,11 +107,17 @@ def render():
         return
 
     # ── 페이지당 결과 수 선택 ────────────────────────────────────────────────
+    total  = results["total"]
+    facets = " ".join(
+        f'<span style="color:#999;margin-left:8px;">{html.escape(cat)} {results["facets"][cat]}</span>'
+        for cat in CATEGORIES if results["facets"].get(cat)
+    )
     col_info, col_per_page = st.columns([4, 1])
     with col_info:
         st.markdown(
-            f'<span style="font-size:0.88rem;color:#555;">검색 결과 <b>{len(results)}건</b>'
-            f' &mdash; &ldquo;{html.escape(keyword)}&rdquo;</span>',
+            f'<span style="font-size:0.88rem;color:#555;">검색 결과 <b>{total}건</b>'
+            f' &mdash; &ldquo;{html.escape(keyword)}&rdquo;</span>'
+            f'<span style="font-size:0.75rem;">{facets}</span>',
             unsafe_allow_html=True,
         )
     with col_per_page:
@@ -121,13 +130,12 @@ def render():
         )
 
     # ── 페이지네이션 계산 ────────────────────────────────────────────────────
-    total        = len(results)
     total_pages  = max(1, (total + per_page - 1) // per_page)
-    current_page = min(st.session_state.get("_page", 0), total_pages - 1)
+    current_page = st.session_state.get("_page", 0)
+    page_results = results["rows"]
 
     start        = current_page * per_page
-    end          = min(start + per_page, total)
-    page_results = results[start:end]
+    end          = start + len(page_results)
 
     st.markdown("")
     for row in page_results:
@@ -150,17 +158,45 @@ def render():
                 unsafe_allow_html=True,
             )
         with pcol3:
-            if st.button("다음 →", type="primary", disabled=(current_page >= total_pages - 1), use_container_width=True):
+            no_next = results["next_cursor"] is None
+            if st.button("다음 →", type="primary", disabled=no_next, use_container_width=True):
                 st.session_state["_page"] = current_page + 1
                 st.rerun()
 
 
+def _fetch_page(keyword: str, selected_categories: list[str]):
+    """
+    현재 페이지만 DB에서 조회하여 session_state["_results"] 에 보관.
+
+    페이지 경계는 키셋 커서(_cursors[i] = i번째 페이지 시작 커서)로 관리한다.
+    검색어·필터·페이지 크기가 바뀌면 첫 페이지부터 다시 조회한다.
+    """
+    per_page = st.session_state.get("per_page", 10)
+    qkey = (keyword, tuple(selected_categories), per_page)
+    if st.session_state.get("_results_qkey") != qkey:
+        st.session_state["_results_qkey"] = qkey
+        st.session_state["_cursors"] = [None]
+        st.session_state["_page"] = 0
+        st.session_state.pop("_results_page", None)
+
+    cursors = st.session_state["_cursors"]
+    page = min(st.session_state.get("_page", 0), len(cursors) - 1)
+    st.session_state["_page"] = page
+    if st.session_state.get("_results_page") == page:
+        return
+
+    results = run_search_page(keyword, selected_categories, after=cursors[page], per_page=per_page)
+    if results["next_cursor"] is not None and len(cursors) == page + 1:
+        cursors.append(results["next_cursor"])
+    st.session_state["_results"] = results
+    st.session_state["_results_page"] = page
+
+
 def _render_article_card(row: dict, keyword: str):
     article_number = row["article_number"] or ""
     article_title  = row["article_title"] or ""
     doc_name       = row["doc_name"]
     doc_category   = row["doc_category"]
-    article_text   = row["article_text"]
     source_type    = row.get("source_type", "pdf")
     enacted_date   = row.get("enacted_date") or ""
 
@@ -168,18 +204,8 @@ def _render_article_card(row: dict, keyword: str):
     src_label = "크롤링" if source_type == "crawler" else "PDF"
     date_part = f"  ·  시행 {enacted_date}" if enacted_date else ""
 
-    # 정규화 + 3줄 분량 스니펫
-    text = normalize_article_text(article_text).replace("\n", " ")
-    if keyword:
-        idx = text.lower().find(keyword.lower())
-        if idx >= 0:
-            s = max(0, idx - 30)
-            e = min(len(text), idx + len(keyword) + 100)
-            snippet = ("…" if s > 0 else "") + text[s:e] + ("…" if e < len(text) else "")
-        else:
-            snippet = text[:130] + ("…" if len(text) > 130 else "")
-    else:
-        snippet = text[:130] + ("…" if len(text) > 130 else "")
+    # 검색 엔진이 만들어 둔 스니펫 (일치 구간 굵게)
+    snippet = row["snippet_md"]
 
     active    = st.session_state.get("side_panel")
     is_active = active is not None and active.get("id") == row.get("id")